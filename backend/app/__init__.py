@@ -11,6 +11,7 @@ from .config import Config, get_config
 from .extensions import db, migrate
 from .api import accounts_bp, notes_bp, auth_bp, search_bp, sync_logs_bp
 from .utils.logger import setup_logger, get_logger
+from .utils.json_utils import HAS_ORJSON, OrjsonProvider
 
 # WebSocket support (optional)
 try:
@@ -36,6 +37,10 @@ def create_app(config_class=None):
     app = Flask(__name__)
     app.config.from_object(config_class)
     
+    # Use orjson for jsonify / request.get_json when available
+    if HAS_ORJSON:
+        app.json = OrjsonProvider(app)
+    
     # Ensure data directories exist
     Config.init_paths()
     
@@ -53,6 +58,7 @@ def create_app(config_class=None):
     
     # Initialize database
     db.init_app(app)
+    _configure_sqlite(app)
     
     # Initialize Flask-Migrate
     migrate.init_app(app, db)
@@ -62,8 +68,10 @@ def create_app(config_class=None):
     
     # Perform startup tasks
     # Note: Use 'flask db upgrade' to create/update database tables
-    with app.app_context():
-        _cleanup_stale_tasks(logger)
+    if app.config.get('RUN_STARTUP_TASKS', True):
+        with app.app_context():
+            _warm_db_pool(app, logger)
+            _cleanup_stale_tasks(logger)
     
     # Register handlers and hooks
     _register_error_handlers(app)
@@ -91,6 +99,59 @@ def _register_blueprints(app):
     app.register_blueprint(sync_logs_bp, url_prefix='/api')
 
 
+def _configure_sqlite(app):
+    """Set the SQLite journal mode once and apply pragmas on every new connection.
+    
+    No-op for other databases.
+    """
+    if not app.config.get('SQLALCHEMY_DATABASE_URI', '').startswith('sqlite'):
+        return
+    
+    from sqlalchemy import event
+    pragmas = app.config.get('SQLITE_PRAGMAS', ())
+    journal_mode = app.config.get('SQLITE_JOURNAL_MODE')
+    
+    with app.app_context():
+        @event.listens_for(db.engine, 'connect')
+        def _set_sqlite_pragmas(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+        
+        # journal_mode persists in the database file; no need to repeat it per connection
+        if journal_mode:
+            try:
+                with db.engine.connect() as conn:
+                    conn.exec_driver_sql(f'PRAGMA journal_mode={journal_mode}')
+            except Exception as e:
+                get_logger('app').warning(f"Failed to set SQLite journal_mode={journal_mode}: {e}")
+
+
+def _warm_db_pool(app, logger):
+    """Open DB_POOL_WARMUP connections up front so the pool keeps them."""
+    count = min(
+        app.config.get('DB_POOL_WARMUP', 0),
+        app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}).get('pool_size', 0)
+    )
+    if count <= 0:
+        return
+    
+    connections = []
+    try:
+        for _ in range(count):
+            conn = db.engine.connect()
+            conn.execute(db.text('SELECT 1'))
+            connections.append(conn)
+        logger.debug(f"Warmed up {len(connections)} database connections")
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
+    finally:
+        # Closing returns the connections to the pool, which keeps them open
+        for conn in connections:
+            conn.close()
+
+
 def _cleanup_stale_tasks(logger):
     """Clean up stale sync tasks on startup."""
     try:
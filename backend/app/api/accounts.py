@@ -1,7 +1,9 @@
 """
 账号管理 API
 """
-from flask import Blueprint, request
+import threading
+import time
+from flask import Blueprint, current_app, request
 from datetime import datetime
 
 from ..extensions import db
@@ -15,6 +17,55 @@ from ..middleware.auth import require_admin
 accounts_bp = Blueprint('accounts', __name__)
 logger = get_logger('accounts')
 
+# 账号列表快照：前端同步期间会频繁轮询 GET /accounts
+# 保存序列化后的响应体，读取时不查库也不重复序列化；写操作后标记失效，
+# 下一次读取时重建（并发读取只有一个请求重建）
+ACCOUNTS_CACHE_TTL = 1.0
+_accounts_cache = {'ts': 0.0, 'body': None, 'version': 0}
+_accounts_cache_lock = threading.Lock()
+
+
+def invalidate_accounts_cache():
+    """使账号列表快照失效（账号数据或同步状态变化时调用）"""
+    _accounts_cache['version'] += 1
+    _accounts_cache['ts'] = 0.0
+
+
+def _accounts_snapshot_fresh():
+    return (_accounts_cache['body'] is not None
+            and time.monotonic() - _accounts_cache['ts'] < ACCOUNTS_CACHE_TTL)
+
+
+def _get_accounts_snapshot():
+    """获取账号列表响应体（bytes），过期时重建"""
+    if _accounts_snapshot_fresh():
+        return _accounts_cache['body']
+    
+    with _accounts_cache_lock:
+        if _accounts_snapshot_fresh():
+            return _accounts_cache['body']
+        
+        ts = time.monotonic()
+        version = _accounts_cache['version']
+        accounts = Account.query.order_by(Account.id.desc()).all()
+        data = [acc.to_dict() for acc in accounts]
+        response, _ = success_response(
+            data=data,
+            message=f'获取成功，共 {len(data)} 个账号'
+        )
+        _accounts_cache['body'] = response.get_data()
+        # 重建期间有写操作时快照可能已过时，保持失效状态
+        _accounts_cache['ts'] = ts if _accounts_cache['version'] == version else 0.0
+        return _accounts_cache['body']
+
+
+@accounts_bp.after_request
+def _invalidate_on_write(response):
+    """本蓝图内的写操作（添加/删除/同步/停止等）完成后清除列表缓存"""
+    if request.method != 'GET':
+        invalidate_accounts_cache()
+    return response
+
 
 @accounts_bp.route('/accounts', methods=['GET'])
 def get_accounts():
@@ -25,11 +76,7 @@ def get_accounts():
         账号列表数组
     """
     try:
-        accounts = Account.query.order_by(Account.id.desc()).all()
-        return success_response(
-            data=[acc.to_dict() for acc in accounts],
-            message=f'获取成功，共 {len(accounts)} 个账号'
-        )
+        return current_app.response_class(_get_accounts_snapshot(), mimetype='application/json')
     except Exception as e:
         logger.error(f"获取账号列表失败: {e}")
         return ApiResponse.server_error('获取账号列表失败')
@@ -66,7 +113,12 @@ def get_accounts_status():
             'last_sync': acc.last_sync.isoformat() + 'Z' if acc.last_sync else None,
         } for acc in accounts]
         
-        return success_response(data=result)
+        # 状态未变化时返回 304，省去轮询时重复传输相同内容；
+        # no-cache 要求浏览器每次都带 If-None-Match 回源校验
+        response, _ = success_response(data=result)
+        response.add_etag()
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
     except Exception as e:
         logger.error(f"获取账号状态失败: {e}")
         return ApiResponse.server_error('获取账号状态失败')
@@ -93,27 +145,25 @@ def add_account():
     if not is_valid:
         return ApiResponse.validation_error(error_msg)
     
-    # 检查是否已存在
-    existing = Account.query.filter_by(user_id=user_id).first()
-    if existing:
-        return ApiResponse.error('该账号已添加过', 409, 'DUPLICATE_ACCOUNT')
-    
-    # 创建新账号
+    # 创建新账号（已存在时不插入，返回 409）
     try:
-        account = Account(
-            user_id=user_id,
-            name=sanitize_string(data.get('name'), 128) or user_id,
-            avatar=sanitize_string(data.get('avatar'), 512),
-            red_id=sanitize_string(data.get('red_id'), 64),
-            desc=sanitize_string(data.get('desc'), 1000),
-            fans=int(data.get('fans', 0)) if data.get('fans') else 0,
-        )
+        account = _insert_account({
+            'user_id': user_id,
+            'name': sanitize_string(data.get('name'), 128) or user_id,
+            'avatar': sanitize_string(data.get('avatar'), 512),
+            'red_id': sanitize_string(data.get('red_id'), 64),
+            'desc': sanitize_string(data.get('desc'), 1000),
+            'fans': int(data.get('fans', 0)) if data.get('fans') else 0,
+        })
+        if account is None:
+            db.session.rollback()
+            return ApiResponse.error('该账号已添加过', 409, 'DUPLICATE_ACCOUNT')
         
-        db.session.add(account)
+        result = account.to_dict()
         db.session.commit()
         
         logger.info(f"添加账号成功: {user_id}")
-        return ApiResponse.created(account.to_dict(), '账号添加成功')
+        return ApiResponse.created(result, '账号添加成功')
         
     except Exception as e:
         db.session.rollback()
@@ -121,6 +171,41 @@ def add_account():
         return ApiResponse.server_error('添加账号失败')
 
 
+def _insert_account(values):
+    """
+    插入账号，user_id 已存在时不插入
+
+    PostgreSQL / SQLite 使用 INSERT ... ON CONFLICT DO NOTHING RETURNING，
+    重复判断和插入只需一条语句；其他数据库回退到先查询再插入
+
+    Args:
+        values: 账号字段字典
+
+    Returns:
+        新建的 Account，已存在时返回 None
+    """
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        if Account.query.filter_by(user_id=values['user_id']).first():
+            return None
+        account = Account(**values)
+        db.session.add(account)
+        db.session.flush()
+        return account
+    
+    stmt = (
+        insert(Account)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=['user_id'])
+        .returning(Account)
+    )
+    return db.session.execute(stmt).scalar_one_or_none()
+
+
 @accounts_bp.route('/accounts/<int:account_id>', methods=['GET'])
 def get_account(account_id):
     """获取单个账号详情"""
@@ -1,6 +1,9 @@
 """
 认证相关 API
 """
+import hashlib
+import threading
+import time
 from flask import Blueprint, request, current_app
 from datetime import datetime
 
@@ -17,25 +20,99 @@ logger = get_logger('auth')
 # Cookie 验证间隔（秒）- 5分钟内不重复验证
 COOKIE_CHECK_INTERVAL = 300
 
+# 配置 Cookie（XHS_COOKIES）验证结果缓存时间（秒）
+CONFIG_COOKIE_CACHE_TTL = 60
+# {sha1(cookie): (检查时间, (user_id, nickname, avatar) 或 None)}
+_config_cookie_cache = {}
+_config_cookie_lock = threading.Lock()
+
 
 def reset_account_errors():
     """
     清理账号同步的历史错误状态，避免旧的 Cookie 失效信息反复触发
+    
+    只执行 UPDATE，由调用方在同一事务中提交
+    """
+    Account.query.filter(Account.status == 'failed').update(
+        {
+            'status': 'pending',
+            'error_message': None,
+            'progress': 0
+        },
+        synchronize_session=False
+    )
+
+
+def save_validated_cookie(cookie_str, user_id, nickname, avatar, filled_at_dt=None):
+    """
+    保存验证通过的 Cookie（手动添加 / 加密传输共用）
+    
+    停用其他 Cookie、更新或新建当前用户的 Cookie、清理账号失败状态
+    在同一个事务中提交
+    
+    Args:
+        cookie_str: Cookie 字符串
+        user_id, nickname, avatar: Cookie 对应的用户信息
+        filled_at_dt: 前端填写的 Cookie 获取时间（新建时作为计时起点）
+        
+    Returns:
+        保存后的 Cookie 对象
     """
+    now = datetime.utcnow()
     try:
-        Account.query.filter(Account.status == 'failed').update(
-            {
-                'status': 'pending',
-                'error_message': None,
-                'progress': 0
-            },
-            synchronize_session=False
-        )
+        # 检查是否存在同一用户的Cookie（判断是更新还是新增）
+        existing_cookie = Cookie.query.filter_by(user_id=user_id, is_active=True).first() if user_id else None
+        
+        # 将之前的 Cookie 设为非激活
+        Cookie.query.filter_by(is_active=True).update({'is_active': False})
+        
+        if existing_cookie:
+            # 同一用户的Cookie更新：保留原有的运行时间统计
+            logger.info(f"检测到同一用户 {user_id} 的Cookie更新，保留原有运行时间统计")
+            
+            # 更新现有Cookie的内容（重复提交同一 Cookie 时不重新加密写入）
+            if existing_cookie.get_cookie_str() != cookie_str:
+                existing_cookie.set_cookie_str(cookie_str)
+            existing_cookie.nickname = nickname
+            existing_cookie.avatar = avatar
+            existing_cookie.is_active = True
+            existing_cookie.is_valid = True
+            existing_cookie.last_checked = now
+            # 保留原有的 run_start_time、total_run_seconds 等时间统计
+            # 如果之前已失效，重新设置开始时间为现在
+            if not existing_cookie.run_start_time:
+                existing_cookie.run_start_time = now
+                logger.info(f"Cookie 之前已失效，重新开始计时")
+            
+            cookie = existing_cookie
+        else:
+            # 新用户的Cookie：创建新记录，重新开始计时
+            logger.info(f"检测到新用户 {user_id} 的Cookie，重新开始计时")
+            
+            # 保存新 Cookie（加密存储）
+            cookie = Cookie(
+                user_id=user_id,
+                nickname=nickname,
+                avatar=avatar,
+                is_active=True,
+                is_valid=True,
+                last_checked=now,
+                run_start_time=filled_at_dt if filled_at_dt else now,
+                total_run_seconds=0,
+                last_valid_duration=0,
+            )
+            cookie.set_cookie_str(cookie_str)
+            
+            db.session.add(cookie)
+        
+        # 清理历史同步错误，避免旧错误反复触发 Cookie 失效提示
+        reset_account_errors()
+        
         db.session.commit()
-        logger.info("已清理账号的失败状态和错误信息")
-    except Exception as e:
+        return cookie
+    except Exception:
         db.session.rollback()
-        logger.error(f"清理账号错误状态失败: {e}")
+        raise
 
 
 def get_active_cookie():
@@ -45,11 +122,8 @@ def get_active_cookie():
     Returns:
         Cookie 字符串或空字符串
     """
-    cookie = Cookie.query.filter_by(is_active=True, is_valid=True).first()
-    if cookie:
-        return cookie.get_cookie_str()
     # 如果数据库没有，尝试从配置获取
-    return current_app.config.get('XHS_COOKIES', '')
+    return Cookie.get_active_cookie_str() or current_app.config.get('XHS_COOKIES', '')
 
 
 def invalidate_cookie(cookie_id=None):
@@ -88,7 +162,7 @@ def get_recent_valid_cookie():
     recent_cookie = Cookie.query.filter_by(is_valid=True).order_by(Cookie.updated_at.desc()).first()
     if recent_cookie:
         # 将其设为激活
-        Cookie.query.update({'is_active': False})
+        Cookie.query.filter_by(is_active=True).update({'is_active': False})
         recent_cookie.is_active = True
         db.session.commit()
         logger.info(f"自动激活历史 Cookie: {recent_cookie.id}")
@@ -122,8 +196,8 @@ def validate_cookie_if_needed(cookie, force=False):
     was_valid = cookie.is_valid
     
     try:
-        from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-        xhs_apis = XHS_Apis()
+        from ..services.sync.spider import get_xhs_apis
+        xhs_apis = get_xhs_apis()
         
         # 获取解密后的 Cookie
         cookie_str = cookie.get_cookie_str()
@@ -182,50 +256,97 @@ def validate_cookie_if_needed(cookie, force=False):
         return False, None
 
 
+# 用户信息字段的候选键：(basic_info 中的键, 响应根级别的键)，按顺序取第一个非空值
+# selfinfo 接口可能把 nickname 放在根级别，头像可能是 headPhoto/head_photo/image，
+# 用户ID可能是 userId/user_id/red_id
+USER_INFO_FIELDS = {
+    'nickname': (
+        ('nickname',),
+        ('nickname', 'nick_name'),
+    ),
+    'avatar': (
+        ('imageb', 'images', 'avatar', 'head_photo', 'headPhoto'),
+        ('imageb', 'images', 'avatar', 'head_photo', 'headPhoto', 'image'),
+    ),
+    'user_id': (
+        ('user_id', 'userId', 'red_id', 'redId'),
+        ('user_id', 'userId', 'red_id', 'redId'),
+    ),
+}
+
+
+def _pick(data, keys):
+    """返回 data 中第一个非空的字段值"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
 def extract_user_info(res_data):
     """从 API 响应中提取用户信息"""
     if not res_data:
         return None, None, None
     
     # 调试：打印 API 返回的原始数据结构
-    logger.info(f"[extract_user_info] 原始数据键: {list(res_data.keys()) if isinstance(res_data, dict) else type(res_data)}")
+    logger.debug(f"[extract_user_info] 原始数据键: {list(res_data.keys()) if isinstance(res_data, dict) else type(res_data)}")
     
     # 尝试获取 basic_info，如果不存在则使用 data 本身
     basic_info = res_data.get('basic_info', res_data)
     
-    # 调试：打印 basic_info 的键
-    if basic_info and basic_info != res_data:
-        logger.info(f"[extract_user_info] basic_info 键: {list(basic_info.keys()) if isinstance(basic_info, dict) else type(basic_info)}")
-    
-    # 获取昵称（尝试多个字段）
-    # selfinfo 接口可能返回 'nickname' 直接在根级别
-    nickname = (basic_info.get('nickname') or 
-                res_data.get('nickname') or 
-                res_data.get('nick_name') or
-                '未知用户')
-    
-    # 获取头像（尝试多个字段）
-    # selfinfo 接口可能使用 'headPhoto' 或 'head_photo' 或 'image'
-    avatar = (basic_info.get('imageb') or basic_info.get('images') or 
-              basic_info.get('avatar') or basic_info.get('head_photo') or
-              basic_info.get('headPhoto') or
-              res_data.get('imageb') or res_data.get('images') or 
-              res_data.get('avatar') or res_data.get('head_photo') or 
-              res_data.get('headPhoto') or
-              res_data.get('image') or '')
-    
-    # 获取用户ID（尝试多个字段）
-    # selfinfo 接口可能使用 'userId' 或 'user_id'
-    user_id = (basic_info.get('user_id') or basic_info.get('userId') or
-               basic_info.get('red_id') or basic_info.get('redId') or
-               res_data.get('user_id') or res_data.get('userId') or
-               res_data.get('red_id') or res_data.get('redId') or '')
-    
-    logger.info(f"[extract_user_info] 提取结果: user_id={user_id}, nickname={nickname}, avatar={avatar[:50] if avatar else 'None'}...")
+    def field(name):
+        basic_keys, root_keys = USER_INFO_FIELDS[name]
+        return _pick(basic_info, basic_keys) or _pick(res_data, root_keys)
+    
+    nickname = field('nickname') or '未知用户'
+    avatar = field('avatar') or ''
+    user_id = field('user_id') or ''
+    
+    logger.debug(f"[extract_user_info] 提取结果: user_id={user_id}, nickname={nickname}, avatar={avatar[:50] if avatar else 'None'}...")
     
     return user_id, nickname, avatar
 
 
+def get_config_cookie_user(cookies_str):
+    """
+    验证配置中的 Cookie 并返回用户信息（带 TTL 缓存）
+    
+    前端会轮询 /user/me，配置 Cookie 没有数据库记录可存验证结果，
+    这里按 Cookie 哈希缓存 CONFIG_COOKIE_CACHE_TTL 秒；缓存失效时只有一个
+    请求去调用远程接口，并发请求等待其结果（single-flight）。
+    
+    Returns:
+        (user_id, nickname, avatar)，验证失败返回 None
+    """
+    key = hashlib.sha1(cookies_str.encode('utf-8')).hexdigest()
+    
+    entry = _config_cookie_cache.get(key)
+    if entry and time.monotonic() - entry[0] < CONFIG_COOKIE_CACHE_TTL:
+        return entry[1]
+    
+    with _config_cookie_lock:
+        # 等锁期间可能已有其他请求完成验证
+        entry = _config_cookie_cache.get(key)
+        if entry and time.monotonic() - entry[0] < CONFIG_COOKIE_CACHE_TTL:
+            return entry[1]
+        
+        try:
+            from ..services.sync.spider import get_xhs_apis
+            xhs_apis = get_xhs_apis()
+            success, msg, res = xhs_apis.get_user_self_info(cookies_str)
+        except Exception as e:
+            # 异常（网络等）不缓存，下次请求重试
+            logger.error(f"Failed to validate cookie: {e}")
+            return None
+        
+        user_info = None
+        if success and res and res.get('data'):
+            user_info = extract_user_info(res['data'])
+        _config_cookie_cache[key] = (time.monotonic(), user_info)
+        return user_info
+
+
 @auth_bp.route('/user/me', methods=['GET'])
 def get_current_user():
     """
@@ -302,22 +423,16 @@ def get_current_user():
     # 检查配置中的 Cookie
     cookies_str = current_app.config.get('XHS_COOKIES', '')
     if cookies_str:
-        try:
-            from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-            xhs_apis = XHS_Apis()
-            success, msg, res = xhs_apis.get_user_self_info(cookies_str)
-            
-            if success and res.get('data'):
-                user_id, nickname, avatar = extract_user_info(res['data'])
-                return success_response({
-                    'is_connected': True,
-                    'user_id': user_id,
-                    'nickname': nickname,
-                    'avatar': avatar,
-                    'run_info': None,  # 配置中的 Cookie 不统计运行时长
-                })
-        except Exception as e:
-            logger.error(f"Failed to validate cookie: {e}")
+        user_info = get_config_cookie_user(cookies_str)
+        if user_info:
+            user_id, nickname, avatar = user_info
+            return success_response({
+                'is_connected': True,
+                'user_id': user_id,
+                'nickname': nickname,
+                'avatar': avatar,
+                'run_info': None,  # 配置中的 Cookie 不统计运行时长
+            })
     
     return success_response({
         'is_connected': False,
@@ -361,8 +476,8 @@ def manual_cookie():
     
     # 验证 Cookie 有效性
     try:
-        from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-        xhs_apis = XHS_Apis()
+        from ..services.sync.spider import get_xhs_apis
+        xhs_apis = get_xhs_apis()
         
         # 先用 v1 接口验证
         success, msg, res = xhs_apis.get_user_self_info(cookie_str)
@@ -391,55 +506,7 @@ def manual_cookie():
         
         logger.info(f"Cookie 验证成功: user_id={user_id}, nickname={nickname}, avatar={avatar[:50] if avatar else 'None'}...")
         
-        # 检查是否存在同一用户的Cookie（判断是更新还是新增）
-        existing_cookie = Cookie.query.filter_by(user_id=user_id, is_active=True).first() if user_id else None
-        
-        # 将之前的 Cookie 设为非激活
-        Cookie.query.update({'is_active': False})
-        
-        if existing_cookie:
-            # 同一用户的Cookie更新：保留原有的运行时间统计
-            logger.info(f"检测到同一用户 {user_id} 的Cookie更新，保留原有运行时间统计")
-            
-            # 更新现有Cookie的内容
-            existing_cookie.set_cookie_str(cookie_str)
-            existing_cookie.nickname = nickname
-            existing_cookie.avatar = avatar
-            existing_cookie.is_active = True
-            existing_cookie.is_valid = True
-            existing_cookie.last_checked = datetime.utcnow()
-            # 保留原有的 run_start_time、total_run_seconds 等时间统计
-            # 如果之前已失效，重新设置开始时间为现在
-            if not existing_cookie.run_start_time:
-                existing_cookie.run_start_time = datetime.utcnow()
-                logger.info(f"Cookie 之前已失效，重新开始计时")
-            
-            cookie = existing_cookie
-        else:
-            # 新用户的Cookie：创建新记录，重新开始计时
-            logger.info(f"检测到新用户 {user_id} 的Cookie，重新开始计时")
-            
-            # 保存新 Cookie（加密存储）
-            cookie = Cookie(
-                user_id=user_id,
-                nickname=nickname,
-                avatar=avatar,
-                is_active=True,
-                is_valid=True,
-                last_checked=datetime.utcnow(),
-                run_start_time=filled_at_dt if filled_at_dt else datetime.utcnow(),
-                total_run_seconds=0,
-                last_valid_duration=0,
-            )
-            # 使用加密方法设置 Cookie
-            cookie.set_cookie_str(cookie_str)
-            
-            db.session.add(cookie)
-        
-        db.session.commit()
-
-        # 清理历史同步错误，避免旧错误反复触发 Cookie 失效提示
-        reset_account_errors()
+        cookie = save_validated_cookie(cookie_str, user_id, nickname, avatar, filled_at_dt)
         
         # 检查是否安全存储
         crypto = get_crypto()
@@ -564,8 +631,8 @@ def manual_cookie_encrypted():
     
     # 后续流程与 manual_cookie 相同
     try:
-        from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-        xhs_apis = XHS_Apis()
+        from ..services.sync.spider import get_xhs_apis
+        xhs_apis = get_xhs_apis()
         
         success, msg, res = xhs_apis.get_user_self_info(cookie_str)
         logger.info(f"[manual_cookie_encrypted] selfinfo v1: success={success}, msg={msg}")
@@ -587,54 +654,7 @@ def manual_cookie_encrypted():
         
         logger.info(f"Cookie(加密) 验证成功: user_id={user_id}, nickname={nickname}")
         
-        # 检查是否存在同一用户的Cookie（判断是更新还是新增）
-        existing_cookie = Cookie.query.filter_by(user_id=user_id, is_active=True).first() if user_id else None
-        
-        # 将之前的 Cookie 设为非激活
-        Cookie.query.update({'is_active': False})
-        
-        if existing_cookie:
-            # 同一用户的Cookie更新：保留原有的运行时间统计
-            logger.info(f"检测到同一用户 {user_id} 的Cookie更新，保留原有运行时间统计")
-            
-            # 更新现有Cookie的内容
-            existing_cookie.set_cookie_str(cookie_str)
-            existing_cookie.nickname = nickname
-            existing_cookie.avatar = avatar
-            existing_cookie.is_active = True
-            existing_cookie.is_valid = True
-            existing_cookie.last_checked = datetime.utcnow()
-            # 保留原有的 run_start_time、total_run_seconds 等时间统计
-            # 如果之前已失效，重新设置开始时间为现在
-            if not existing_cookie.run_start_time:
-                existing_cookie.run_start_time = datetime.utcnow()
-                logger.info(f"Cookie 之前已失效，重新开始计时")
-            
-            cookie = existing_cookie
-        else:
-            # 新用户的Cookie：创建新记录，重新开始计时
-            logger.info(f"检测到新用户 {user_id} 的Cookie，重新开始计时")
-            
-            # 保存新 Cookie
-            cookie = Cookie(
-                user_id=user_id,
-                nickname=nickname,
-                avatar=avatar,
-                is_active=True,
-                is_valid=True,
-                last_checked=datetime.utcnow(),
-                run_start_time=filled_at_dt if filled_at_dt else datetime.utcnow(),
-                total_run_seconds=0,
-                last_valid_duration=0,
-            )
-            cookie.set_cookie_str(cookie_str)
-            
-            db.session.add(cookie)
-        
-        db.session.commit()
-
-        # 清理历史同步错误，避免旧错误反复触发 Cookie 失效提示
-        reset_account_errors()
+        cookie = save_validated_cookie(cookie_str, user_id, nickname, avatar, filled_at_dt)
         
         crypto = get_crypto()
         run_info = cookie.get_run_info()
@@ -690,7 +710,7 @@ def reactivate_cookie(cookie_id):
         })
     
     # 将其他 Cookie 设为非激活
-    Cookie.query.update({'is_active': False})
+    Cookie.query.filter_by(is_active=True).update({'is_active': False})
     cookie.is_active = True
     db.session.commit()
     
@@ -724,8 +744,8 @@ def debug_cookie():
         })
     
     try:
-        from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-        xhs_apis = XHS_Apis()
+        from ..services.sync.spider import get_xhs_apis
+        xhs_apis = get_xhs_apis()
         
         # 获取 v1 接口数据
         success1, msg1, res1 = xhs_apis.get_user_self_info(cookie_str)
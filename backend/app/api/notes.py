@@ -3,33 +3,65 @@
 """
 import logging
 import os
+from datetime import datetime, timedelta
 
-from flask import Blueprint, jsonify, request, send_from_directory
+from flask import Blueprint, Response, jsonify, request, send_from_directory, stream_with_context
 from sqlalchemy import or_
 
 from ..extensions import db
 from ..models import Note, Account
 from ..config import Config
+from ..utils.json_utils import json_dumps
+from ..utils.file_utils import file_size
 
 notes_bp = Blueprint('notes', __name__)
 logger = logging.getLogger(__name__)
 
+# 导出时每批读取/序列化的笔记数
+EXPORT_BATCH_SIZE = 500
+
+
+# time_range 参数对应的时间跨度
+TIME_RANGE_DELTAS = {
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+}
+
+
+def _time_range_start(time_range: str):
+    """time_range 对应的起始时间，未知取值（含 all）返回 None"""
+    delta = TIME_RANGE_DELTAS.get(time_range)
+    return datetime.now() - delta if delta else None
+
+
+def _parse_date(date_str: str) -> datetime:
+    """解析 YYYY-MM-DD 日期（固定格式直接切片，比 strptime 快得多）
+
+    Raises:
+        ValueError: 格式不正确
+    """
+    digits = date_str[0:4] + date_str[5:7] + date_str[8:10]
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-' or not digits.isdigit():
+        raise ValueError(f'invalid date: {date_str!r}')
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+
 
 @notes_bp.route('/media/<path:filename>', methods=['GET'])
 def get_note_media(filename):
     """提供本地缓存的笔记封面/图片预览"""
-    Config.init_paths()
     filepath = os.path.join(Config.MEDIA_PATH, filename)
 
     # 文件缺失时尝试按命名规则回源下载（避免重启/重新部署后封面丢失）
-    if (not os.path.exists(filepath)) or os.path.getsize(filepath) == 0:
+    # 常见情况（文件已存在）只做一次 stat
+    if file_size(filepath) <= 0:
         try:
             _restore_cover_if_missing(filename)
         except Exception as e:
             logger.info(f"Restore media failed for {filename}: {e}")
 
-    if not os.path.exists(filepath):
-        return jsonify({'success': False, 'message': 'media not found'}), 404
+        if not os.path.exists(filepath):
+            return jsonify({'success': False, 'message': 'media not found'}), 404
 
     return send_from_directory(Config.MEDIA_PATH, filename)
 
@@ -105,7 +137,7 @@ def get_notes():
         if start_date_str:
             try:
                 # 验证日期格式
-                start_dt = datetime.strptime(start_date_str, '%Y-%m-%d')
+                start_dt = _parse_date(start_date_str)
                 # upload_time 是字符串格式 (如 "2024-12-01" 或 "2024-12-01 10:30:00")
                 # 对于空的 upload_time，回退使用 last_updated (同步时间)
                 query = query.filter(
@@ -127,7 +159,7 @@ def get_notes():
                 pass
         if end_date_str:
             try:
-                end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+                end_date = _parse_date(end_date_str)
                 # 结束日期加一天，包含当天
                 end_date_next = end_date + timedelta(days=1)
                 query = query.filter(
@@ -148,15 +180,7 @@ def get_notes():
             except ValueError:
                 pass
     elif time_range != 'all':
-        now = datetime.now()
-        if time_range == 'day':
-            start_date = now - timedelta(days=1)
-        elif time_range == 'week':
-            start_date = now - timedelta(weeks=1)
-        elif time_range == 'month':
-            start_date = now - timedelta(days=30)
-        else:
-            start_date = None
+        start_date = _time_range_start(time_range)
         
         if start_date:
             # 使用 upload_time (发布时间) 进行过滤
@@ -234,7 +258,8 @@ def delete_note(note_id):
 @notes_bp.route('/notes/batch-delete', methods=['POST'])
 def batch_delete_notes():
     """批量删除笔记"""
-    note_ids = request.json.get('note_ids', [])
+    data = request.json or {}
+    note_ids = data.get('note_ids', [])
     if not note_ids:
         return jsonify({'error': 'No note_ids provided'}), 400
     
@@ -267,8 +292,6 @@ def get_notes_stats():
 @notes_bp.route('/media/stats', methods=['GET'])
 def get_media_stats():
     """获取媒体文件统计信息"""
-    Config.init_paths()
-    
     # 统计数据库中的封面情况
     total_notes = Note.query.count()
     with_cover_local = Note.query.filter(
@@ -339,7 +362,6 @@ def get_media_stats():
 @notes_bp.route('/media/list', methods=['GET'])
 def list_media_files():
     """列出本地媒体文件"""
-    Config.init_paths()
     media_path = Config.MEDIA_PATH
     
     page = request.args.get('page', 1, type=int)
@@ -410,7 +432,7 @@ def export_notes():
     
     if note_ids:
         # 模式1：导出指定笔记
-        notes = Note.query.filter(Note.note_id.in_(note_ids)).all()
+        query = Note.query.filter(Note.note_id.in_(note_ids))
     else:
         # 模式2：按筛选条件导出
         user_ids = data.get('user_ids', '')
@@ -450,7 +472,7 @@ def export_notes():
         if start_date_str or end_date_str:
             if start_date_str:
                 try:
-                    start_dt = datetime.strptime(start_date_str, '%Y-%m-%d')
+                    start_dt = _parse_date(start_date_str)
                     query = query.filter(
                         or_(
                             and_(
@@ -468,7 +490,7 @@ def export_notes():
                     pass
             if end_date_str:
                 try:
-                    end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+                    end_date = _parse_date(end_date_str)
                     end_date_next = end_date + timedelta(days=1)
                     query = query.filter(
                         or_(
@@ -486,15 +508,7 @@ def export_notes():
                 except ValueError:
                     pass
         elif time_range != 'all':
-            now = datetime.now()
-            if time_range == 'day':
-                start_date = now - timedelta(days=1)
-            elif time_range == 'week':
-                start_date = now - timedelta(weeks=1)
-            elif time_range == 'month':
-                start_date = now - timedelta(days=30)
-            else:
-                start_date = None
+            start_date = _time_range_start(time_range)
             
             if start_date:
                 start_date_str_calc = start_date.strftime('%Y-%m-%d')
@@ -526,16 +540,25 @@ def export_notes():
         if share_count_min is not None:
             query = query.filter(Note.share_count >= share_count_min)
         
-        notes = query.all()
-    
-    result_data = [note.to_dict() for note in notes]
     
     # TODO: 实现 Excel 导出
-    return jsonify({
-        'success': True,
-        'data': result_data,
-        'count': len(result_data)
-    })
+    # 流式输出：按批读取并逐批序列化，避免一次性加载全部笔记
+    def generate():
+        count = 0
+        yield '{"success":true,"data":['
+        chunk = []
+        for note in query.yield_per(EXPORT_BATCH_SIZE):
+            chunk.append(json_dumps(note.to_dict()))
+            if len(chunk) >= EXPORT_BATCH_SIZE:
+                yield (',' if count else '') + ','.join(chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            yield (',' if count else '') + ','.join(chunk)
+            count += len(chunk)
+        yield f'],"count":{count}}}'
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 def _restore_cover_if_missing(filename: str) -> bool:
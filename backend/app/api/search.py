@@ -9,11 +9,8 @@ search_bp = Blueprint('search', __name__)
 
 
 def get_active_cookie_str():
-    """获取当前激活的 Cookie 字符串"""
-    cookie = Cookie.query.filter_by(is_active=True, is_valid=True).first()
-    if cookie:
-        return cookie.cookie_str
-    return current_app.config.get('XHS_COOKIES', '')
+    """获取当前激活的 Cookie 字符串（已解密）"""
+    return Cookie.get_active_cookie_str() or current_app.config.get('XHS_COOKIES', '')
 
 
 @search_bp.route('/search/users', methods=['GET'])
@@ -36,8 +33,8 @@ def search_users():
         return jsonify({'error': '请先登录小红书账号'}), 401
     
     try:
-        from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-        xhs_apis = XHS_Apis()
+        from ..services.sync.spider import get_xhs_apis
+        xhs_apis = get_xhs_apis()
         success, msg, res = xhs_apis.search_user(keyword, cookie_str, page=1)
         
         if not success:
@@ -120,8 +117,8 @@ def search_notes():
         return jsonify({'error': '请先登录小红书账号'}), 401
     
     try:
-        from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-        xhs_apis = XHS_Apis()
+        from ..services.sync.spider import get_xhs_apis
+        xhs_apis = get_xhs_apis()
         success, msg, res = xhs_apis.search_note(keyword, cookie_str, page=page, 
                                                   sort_type_choice=sort, note_type=note_type)
         
@@ -5,16 +5,20 @@
 import os
 import secrets
 
-# 尝试加载 .env 文件
+from sqlalchemy.pool import StaticPool
+
+# 获取 backend 目录的绝对路径
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_PATH = os.path.join(BASE_DIR, '.env')
+
+# 尝试加载 .env 文件（只在导入时加载一次；使用固定路径，
+# 不依赖工作目录，也省去 find_dotenv 逐级向上查找）
 try:
     from dotenv import load_dotenv
-    load_dotenv()
+    load_dotenv(ENV_PATH)
 except ImportError:
     pass
 
-# 获取 backend 目录的绝对路径
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
 
 class Config:
     """基础配置"""
@@ -39,12 +43,37 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
     # PostgreSQL connection pooling options
+    # A steady pool sized for the gthread workers plus the background sync
+    # thread; overflow only absorbs bursts, and pool_timeout makes an exhausted
+    # pool fail fast instead of stalling request threads for 30s
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': 10,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', '20')),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', '10')),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', '10')),
         'pool_recycle': 300,
         'pool_pre_ping': True,
-        'max_overflow': 20,
     }
+    # Connections to open at startup so the first requests skip the connect
+    # handshake (0 = disabled, capped at pool_size)
+    DB_POOL_WARMUP = int(os.environ.get('DB_POOL_WARMUP', '0'))
+    
+    # Run startup tasks (pool warm-up, stale sync cleanup) in create_app.
+    # CLI processes such as 'flask db upgrade' turn this off: they exit right
+    # away and may run before the tables exist.
+    RUN_STARTUP_TASKS = os.environ.get('RUN_STARTUP_TASKS', 'true').lower() in ('1', 'true', 'yes')
+    
+    # SQLite settings (only applied when DATABASE_URL is sqlite, e.g. local
+    # development and tests). WAL lets readers run alongside the sync writer;
+    # it is stored in the database file, so it is set once at startup.
+    SQLITE_JOURNAL_MODE = 'WAL'
+    # Per-connection pragmas: synchronous=NORMAL avoids an fsync per commit,
+    # cache_size=-64000 gives each connection a 64 MB page cache
+    SQLITE_PRAGMAS = (
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA cache_size=-64000',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA mmap_size=268435456',
+    )
     
     # ==================== CORS 配置 ====================
     # 允许的跨域来源（逗号分隔）
@@ -64,6 +93,8 @@ class Config:
     # ==================== 同步配置 ====================
     # 同步请求间隔（秒）
     SYNC_REQUEST_DELAY = float(os.environ.get('SYNC_REQUEST_DELAY', '1.0'))
+    # 同步请求突发上限（令牌桶容量，所有并发同步共享）
+    SYNC_REQUEST_BURST = float(os.environ.get('SYNC_REQUEST_BURST', '5'))
     # 深度同步随机延迟区间（秒）
     # 【重要】小红书反爬策略很严格，延迟必须足够长！
     # 参考 fix_deep_sync.py 策略: 5-15秒基础延迟 + 20%概率额外暂停(最长30秒)
@@ -83,12 +114,17 @@ class Config:
     # 最大并发同步数
     MAX_CONCURRENT_SYNCS = int(os.environ.get('MAX_CONCURRENT_SYNCS', '3'))
     
+    # 数据目录是否已初始化（每个进程只检查一次）
+    _paths_initialized = False
+    
     @staticmethod
     def init_paths():
-        """初始化数据目录"""
-        for path in [Config.MEDIA_PATH, Config.EXCEL_PATH]:
-            if not os.path.exists(path):
-                os.makedirs(path)
+        """初始化数据目录（由 create_app 在启动时调用，进程内只做一次文件系统检查）"""
+        if Config._paths_initialized:
+            return
+        for path in (Config.MEDIA_PATH, Config.EXCEL_PATH):
+            os.makedirs(path, exist_ok=True)
+        Config._paths_initialized = True
     
     @classmethod
     def get_cors_config(cls):
@@ -111,6 +147,8 @@ class ProductionConfig(Config):
     """生产环境配置"""
     DEBUG = False
     LOG_LEVEL = 'WARNING'
+    # 预热与 gunicorn 线程数相当的连接
+    DB_POOL_WARMUP = int(os.environ.get('DB_POOL_WARMUP', '4'))
     
     @classmethod
     def validate(cls):
@@ -132,11 +170,14 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     """测试环境配置"""
     TESTING = True
-    # Use separate test database, override from environment if needed
-    SQLALCHEMY_DATABASE_URI = os.environ.get(
-        'TEST_DATABASE_URL',
-        os.environ.get('DATABASE_URL', '').replace('/xhs_data', '/xhs_test')
-    )
+    # 默认使用内存 SQLite（可通过 TEST_DATABASE_URL 指定其他测试库）
+    SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL', 'sqlite:///:memory:')
+    if SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        # StaticPool：所有线程共用同一个连接，内存库在整个测试会话内保持存在
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'poolclass': StaticPool,
+            'connect_args': {'check_same_thread': False},
+        }
 
 
 # 配置映射
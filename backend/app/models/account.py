@@ -4,6 +4,7 @@
 import json
 from datetime import datetime
 from ..extensions import db
+from ..utils.json_utils import json_loads
 
 
 class Account(db.Model):
@@ -26,7 +27,7 @@ class Account(db.Model):
     total_msgs = db.Column(db.Integer, default=0)
     loaded_msgs = db.Column(db.Integer, default=0)
     progress = db.Column(db.Integer, default=0)
-    status = db.Column(db.String(32), default='pending')  # pending, processing, completed, failed
+    status = db.Column(db.String(32), default='pending', index=True)  # pending, processing, completed, failed
     error_message = db.Column(db.Text)  # 同步失败时的错误信息
     sync_heartbeat = db.Column(db.DateTime)  # 同步心跳时间，用于检测僵死任务
     
@@ -61,7 +62,7 @@ class Account(db.Model):
         sync_logs_data = None
         if self.sync_logs:
             try:
-                full_logs = json.loads(self.sync_logs)
+                full_logs = json_loads(self.sync_logs)
                 if include_full_logs:
                     sync_logs_data = full_logs
                 else:
@@ -112,7 +113,7 @@ class Account(db.Model):
             return {'issues': [], 'total': 0, 'page': page, 'page_size': page_size, 'total_pages': 0}
         
         try:
-            full_logs = json.loads(self.sync_logs)
+            full_logs = json_loads(self.sync_logs)
             all_issues = full_logs.get('issues', [])
             
             # Filter by type if specified
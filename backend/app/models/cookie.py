@@ -24,6 +24,11 @@ class Cookie(db.Model):
     """
     __tablename__ = 'cookies'
     
+    # 激活 Cookie 查询（is_active / is_valid 过滤，按 updated_at 取最新）直接走索引
+    __table_args__ = (
+        db.Index('ix_cookies_active_valid_updated', 'is_active', 'is_valid', db.desc('updated_at')),
+    )
+    
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     
     # Cookie 存储字段
@@ -58,18 +63,38 @@ class Cookie(db.Model):
         
         优先从 encrypted_cookie 解密，如果失败则从 cookie_str 获取
         """
+        return self._decode_cookie(self.encrypted_cookie, self.cookie_str)
+    
+    @staticmethod
+    def _decode_cookie(encrypted_cookie, cookie_str) -> str:
+        """解密 encrypted_cookie，失败时回退到明文 cookie_str"""
         # 优先使用加密存储
-        if self.encrypted_cookie:
+        if encrypted_cookie:
             try:
                 from ..utils.crypto import decrypt_cookie
-                decrypted = decrypt_cookie(self.encrypted_cookie)
+                decrypted = decrypt_cookie(encrypted_cookie)
                 if decrypted:
                     return decrypted
             except Exception:
                 pass
         
         # 后备：使用明文存储
-        return self.cookie_str or ''
+        return cookie_str or ''
+    
+    @classmethod
+    def get_active_cookie_str(cls) -> str:
+        """
+        获取当前激活且有效的 Cookie 字符串（已解密）
+        
+        只查询两个 Cookie 字段，不加载整行 ORM 对象；查询语句在模块加载时构建一次
+        
+        Returns:
+            Cookie 字符串，没有激活的 Cookie 时返回空字符串
+        """
+        row = db.session.execute(_ACTIVE_COOKIE_STMT).first()
+        if row is None:
+            return ''
+        return cls._decode_cookie(row.encrypted_cookie, row.cookie_str)
     
     def set_cookie_str(self, cookie_str: str) -> None:
         """
@@ -171,3 +196,12 @@ class Cookie(db.Model):
     
     def __repr__(self):
         return f'<Cookie {self.nickname or self.user_id}>'
+
+
+# 激活 Cookie 查询（走 ix_cookies_active_valid_updated 索引），构建一次重复使用
+_ACTIVE_COOKIE_STMT = (
+    db.select(Cookie.encrypted_cookie, Cookie.cookie_str)
+    .filter_by(is_active=True, is_valid=True)
+    .order_by(Cookie.updated_at.desc())
+    .limit(1)
+)
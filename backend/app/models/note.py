@@ -1,9 +1,9 @@
 """
 笔记模型
 """
-import json
 from datetime import datetime
 from ..extensions import db
+from ..utils.json_utils import json_loads
 
 
 class Note(db.Model):
@@ -11,9 +11,15 @@ class Note(db.Model):
     __tablename__ = 'notes'
     
     # Add composite index for common query patterns
+    # (user_id, type, upload_time DESC) serves the default note list query
+    # "WHERE user_id IN (...) AND type = ? ORDER BY upload_time DESC" without a
+    # sort step, and still covers plain (user_id, type) lookups.
+    # (user_id, upload_time DESC) serves "latest notes per user" as an index
+    # range scan in the same order the UI lists them.
     __table_args__ = (
-        db.Index('ix_notes_user_upload_time', 'user_id', 'upload_time'),
-        db.Index('ix_notes_user_type', 'user_id', 'type'),
+        db.Index('ix_notes_user_upload_time_desc', 'user_id', db.desc('upload_time')),
+        db.Index('ix_notes_user_type_upload_time', 'user_id', 'type', db.desc('upload_time'),
+                 postgresql_include=['title']),
     )
     
     note_id = db.Column(db.String(64), primary_key=True)
@@ -33,7 +39,12 @@ class Note(db.Model):
     share_count = db.Column(db.Integer, default=0)
     
     # 媒体信息
-    upload_time = db.Column(db.String(64), index=True)
+    # 格式固定为 "YYYY-MM-DD HH:MM:SS"，按字节比较即为时间顺序；
+    # PostgreSQL 上使用 "C" 排序规则，避免比较/排序时走 locale 的 strcoll
+    upload_time = db.Column(
+        db.String(64).with_variant(db.String(64, collation='C'), 'postgresql'),
+        index=True
+    )
     video_addr = db.Column(db.String(512))
     image_list = db.Column(db.Text)  # JSON 格式存储图片列表
     tags = db.Column(db.Text)  # JSON 格式存储标签
@@ -52,7 +63,7 @@ class Note(db.Model):
         """获取图片列表"""
         if self.image_list:
             try:
-                return json.loads(self.image_list)
+                return json_loads(self.image_list)
             except:
                 return []
         return []
@@ -61,7 +72,7 @@ class Note(db.Model):
         """获取标签列表"""
         if self.tags:
             try:
-                return json.loads(self.tags)
+                return json_loads(self.tags)
             except:
                 return []
         return []
@@ -6,11 +6,17 @@ This package contains refactored sync service components:
 - session_pool: HTTP session pooling for connection reuse
 - log_collector: Sync log collection and storage
 - media_queue: Async media download queue
+- spider: Lazy Spider_XHS loader
+- note_data: Normalized note record for the save paths
+- rate_limiter: Shared token bucket for outbound list requests
 """
 from .delay_manager import AdaptiveDelayManager, get_adaptive_delay_manager
 from .session_pool import RequestSessionPool, get_request_session_pool
 from .log_collector import SyncLogCollector
 from .media_queue import MediaDownloadQueue, get_media_download_queue
+from .spider import load_spider, is_spider_available, get_xhs_apis, get_data_spider
+from .note_data import NoteData
+from .rate_limiter import TokenBucket, get_request_rate_limiter
 
 __all__ = [
     'AdaptiveDelayManager',
@@ -20,4 +26,11 @@ __all__ = [
     'SyncLogCollector',
     'MediaDownloadQueue',
     'get_media_download_queue',
+    'load_spider',
+    'is_spider_available',
+    'get_xhs_apis',
+    'get_data_spider',
+    'NoteData',
+    'TokenBucket',
+    'get_request_rate_limiter',
 ]
@@ -20,6 +20,9 @@ class AdaptiveDelayManager:
     1. Exponential backoff: Double delay on each rate limit (up to max_delay)
     2. Fast recovery: Halve delay after N consecutive successes (down to min_delay)
     3. Dynamic adjustment: Automatically adjust base delay based on rate limit frequency
+    4. Decorrelated jitter: The cooldown after a rate limit is drawn from
+       [current_delay, 3 * previous cooldown], so retries after a burst of
+       rate limits spread out instead of firing together
     
     Example:
         >>> manager = AdaptiveDelayManager(min_delay=5.0, max_delay=300.0)
@@ -57,6 +60,7 @@ class AdaptiveDelayManager:
         self._current_delay = initial_delay
         self._consecutive_success = 0
         self._rate_limit_count = 0
+        self._rate_limit_wait = 0.0  # Cooldown drawn at the last rate limit (0 = none)
         self._lock = threading.Lock()
         
         logger.info(
@@ -74,15 +78,24 @@ class AdaptiveDelayManager:
                 self._current_delay * self.backoff_factor,
                 self.max_delay
             )
+            # Decorrelated jitter: grow from the previous cooldown, not a fixed schedule
+            prev_wait = self._rate_limit_wait or self._current_delay
+            self._rate_limit_wait = min(
+                random.uniform(self._current_delay, prev_wait * 3),
+                self.max_delay
+            )
             logger.warning(
                 f"[AdaptiveDelay] Rate limit #{self._rate_limit_count}: "
-                f"delay {old_delay:.1f}s -> {self._current_delay:.1f}s"
+                f"delay {old_delay:.1f}s -> {self._current_delay:.1f}s, "
+                f"cooldown {self._rate_limit_wait:.1f}s"
             )
     
     def record_success(self) -> None:
         """Record a successful request, potentially reduce delay."""
         with self._lock:
             self._consecutive_success += 1
+            # Rate limit streak is over; the next cooldown starts from current_delay
+            self._rate_limit_wait = 0.0
             
             # Fast recovery after consecutive successes
             if self._consecutive_success >= self.recovery_threshold:
@@ -112,14 +125,14 @@ class AdaptiveDelayManager:
     def get_rate_limit_wait(self) -> float:
         """Get wait time after rate limit (longer than normal delay).
         
+        The value is drawn once per rate limit in record_rate_limit(), so
+        repeated calls for the same event (progress broadcast, sleep) agree.
+        
         Returns:
             Extended wait time in seconds for rate limit recovery
         """
         with self._lock:
-            # Extra wait time based on consecutive rate limits
-            base_wait = self._current_delay * 2
-            extra_wait = min(self._rate_limit_count * 15, 120)
-            return base_wait + extra_wait + random.uniform(5, 15)
+            return self._rate_limit_wait or self._current_delay
     
     def reset(self) -> None:
         """Reset to initial state."""
@@ -127,6 +140,7 @@ class AdaptiveDelayManager:
             self._current_delay = self.initial_delay
             self._consecutive_success = 0
             self._rate_limit_count = 0
+            self._rate_limit_wait = 0.0
             logger.info("[AdaptiveDelay] Reset to initial state")
     
     def get_stats(self) -> Dict:
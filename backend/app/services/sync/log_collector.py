@@ -4,12 +4,12 @@ Sync Log Collector - Collect and store sync operation logs
 This module provides structured logging for sync operations,
 tracking issues like rate limits, missing fields, and failures.
 """
-import json
 import threading
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ...utils.logger import get_logger
+from ...utils.json_utils import json_dumps
 
 logger = get_logger('log_collector')
 
@@ -44,6 +44,12 @@ class SyncLogCollector:
     TYPE_MEDIA_FAILED = 'media_failed'       # Media download failure
     TYPE_AUTH_ERROR = 'auth_error'           # Authentication error
     
+    # Issue types with a matching summary counter (TYPE_AUTH_ERROR has none)
+    _COUNTED_TYPES = frozenset((
+        TYPE_RATE_LIMITED, TYPE_UNAVAILABLE, TYPE_MISSING_FIELD,
+        TYPE_FETCH_FAILED, TYPE_TOKEN_REFRESH, TYPE_MEDIA_FAILED,
+    ))
+    
     # Maximum issues to store (prevent memory bloat)
     MAX_ISSUES = 500
     
@@ -93,6 +99,15 @@ class SyncLogCollector:
             extra: Additional context data
         """
         with self._lock:
+            # Update summary counts
+            if issue_type in self._COUNTED_TYPES:
+                self.summary[issue_type] += 1
+            
+            # Limit issue list size; past the cap only the counters change,
+            # so long deep syncs skip building records that would be dropped
+            if len(self.issues) >= self.MAX_ISSUES:
+                return
+            
             issue = {
                 'type': issue_type,
                 'time': datetime.utcnow().isoformat() + 'Z',
@@ -105,24 +120,7 @@ class SyncLogCollector:
                 issue['fields'] = fields
             if extra:
                 issue['extra'] = extra
-            
-            # Limit issue list size
-            if len(self.issues) < self.MAX_ISSUES:
-                self.issues.append(issue)
-            
-            # Update summary counts
-            if issue_type == self.TYPE_RATE_LIMITED:
-                self.summary['rate_limited'] += 1
-            elif issue_type == self.TYPE_UNAVAILABLE:
-                self.summary['unavailable'] += 1
-            elif issue_type == self.TYPE_MISSING_FIELD:
-                self.summary['missing_field'] += 1
-            elif issue_type == self.TYPE_FETCH_FAILED:
-                self.summary['fetch_failed'] += 1
-            elif issue_type == self.TYPE_TOKEN_REFRESH:
-                self.summary['token_refresh'] += 1
-            elif issue_type == self.TYPE_MEDIA_FAILED:
-                self.summary['media_failed'] += 1
+            self.issues.append(issue)
     
     def record_success(self) -> None:
         """Record a successfully processed note."""
@@ -173,7 +171,7 @@ class SyncLogCollector:
             logs_data = self.finalize()
             account = Account.query.get(self.account_id)
             if account:
-                account.sync_logs = json.dumps(logs_data, ensure_ascii=False)
+                account.sync_logs = json_dumps(logs_data)
                 db.session.commit()
                 logger.info(f"Sync logs saved for account {self.account_id}")
                 return True
@@ -12,10 +12,27 @@ from typing import Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 from ...utils.logger import get_logger
+from ...utils.file_utils import file_size
 from ...config import Config
 
 logger = get_logger('media_queue')
 
+# Headers used when Spider_XHS is not available
+_FALLBACK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def _download_headers() -> Dict:
+    """Request headers for media downloads.
+
+    Goes through the cached Spider_XHS loader, so a missing package costs one
+    failed import per process instead of one per download.
+    """
+    from .spider import load_spider
+    spider = load_spider()
+    return spider.get_common_headers() if spider else dict(_FALLBACK_HEADERS)
+
 
 class MediaDownloadQueue:
     """Async media download queue using thread pool.
@@ -195,16 +212,8 @@ class MediaDownloadQueue:
             # Lazy import to avoid circular imports
             from .session_pool import get_request_session_pool
             
-            # Import Spider_XHS headers utility
-            try:
-                from Spider_XHS.xhs_utils.xhs_util import get_common_headers
-                headers = get_common_headers()
-            except ImportError:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
+            headers = _download_headers()
             
-            Config.init_paths()
             parsed = urlparse(remote_url)
             ext = os.path.splitext(parsed.path)[1]
             if not ext or len(ext) > 5:
@@ -213,7 +222,7 @@ class MediaDownloadQueue:
             filepath = os.path.join(Config.MEDIA_PATH, filename)
             
             # Skip if file exists and is valid
-            if os.path.exists(filepath) and os.path.getsize(filepath) > 1024:
+            if file_size(filepath) > 1024:
                 return f"/api/media/{filename}"
             
             session_pool = get_request_session_pool()
@@ -251,19 +260,10 @@ class MediaDownloadQueue:
             # Lazy import to avoid circular imports
             from .session_pool import get_request_session_pool
             
-            # Import Spider_XHS headers utility
-            try:
-                from Spider_XHS.xhs_utils.xhs_util import get_common_headers
-                headers = get_common_headers()
-            except ImportError:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
+            headers = _download_headers()
             
-            Config.init_paths()
             note_dir = os.path.join(Config.MEDIA_PATH, str(note_id))
-            if not os.path.exists(note_dir):
-                os.makedirs(note_dir)
+            os.makedirs(note_dir, exist_ok=True)
             
             session_pool = get_request_session_pool()
             downloaded_count = 0
@@ -275,7 +275,7 @@ class MediaDownloadQueue:
                     filename = f"image_{idx}{ext}"
                     filepath = os.path.join(note_dir, filename)
                     
-                    if os.path.exists(filepath) and os.path.getsize(filepath) > 1024:
+                    if file_size(filepath) > 1024:
                         continue
                     
                     # Build fallback URLs
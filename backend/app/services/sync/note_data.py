@@ -0,0 +1,154 @@
+"""
+Note Data - Normalized note record used when saving notes
+
+Detail API results (handle_note_info) and converted list API notes are both
+plain dicts. They are normalized once into a dataclass (slotted on Python
+3.10+) so the save paths read attributes instead of repeating dict lookups
+per field, and the update/insert field logic lives in one place.
+"""
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...utils.json_utils import json_dumps, json_loads
+
+# dataclass(slots=True) needs Python 3.10; older versions get a plain dataclass
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class NoteData:
+    """Note fields as consumed by SyncService save methods.
+
+    Count fields are None when the source did not provide them, so updates
+    keep the stored value instead of resetting it to 0.
+    """
+    note_id: str
+    user_id: Optional[str] = None
+    nickname: Optional[str] = None
+    avatar: Optional[str] = None
+    title: Optional[str] = None
+    desc: Optional[str] = None
+    note_type: Optional[str] = None
+    liked_count: Optional[int] = None
+    collected_count: Optional[int] = None
+    comment_count: Optional[int] = None
+    share_count: Optional[int] = None
+    upload_time: Optional[str] = None
+    video_addr: Optional[str] = None
+    image_list: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    ip_location: Optional[str] = None
+    cover_remote: Optional[str] = None
+    xsec_token: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'NoteData':
+        """Build from a detail/list note dict, resolving the cover URL.
+
+        Args:
+            data: Note dict (handle_note_info output or _convert_list_note)
+
+        Returns:
+            NoteData instance
+        """
+        image_list = data.get('image_list') or []
+        cover_remote = data.get('cover_remote') or data.get('video_cover')
+        if not cover_remote and image_list:
+            cover_remote = image_list[0]
+
+        return cls(
+            note_id=data.get('note_id') or '',
+            user_id=data.get('user_id'),
+            nickname=data.get('nickname'),
+            avatar=data.get('avatar'),
+            title=data.get('title'),
+            desc=data.get('desc'),
+            note_type=data.get('note_type'),
+            liked_count=data.get('liked_count'),
+            collected_count=data.get('collected_count'),
+            comment_count=data.get('comment_count'),
+            share_count=data.get('share_count'),
+            upload_time=data.get('upload_time'),
+            video_addr=data.get('video_addr'),
+            image_list=image_list,
+            tags=data.get('tags') or [],
+            ip_location=data.get('ip_location'),
+            cover_remote=cover_remote,
+            xsec_token=data.get('xsec_token'),
+        )
+
+    def apply_to(self, note: Any, now: datetime) -> None:
+        """Merge into an existing Note, keeping stored values for missing fields.
+
+        Args:
+            note: Existing Note instance
+            now: Timestamp for last_updated
+        """
+        note.nickname = self.nickname
+        note.avatar = self.avatar
+        note.title = self.title
+        if self.desc:
+            note.desc = self.desc
+        note.type = self.note_type
+
+        if self.liked_count is not None:
+            note.liked_count = self.liked_count
+        if self.collected_count is not None:
+            note.collected_count = self.collected_count
+        if self.comment_count is not None:
+            note.comment_count = self.comment_count
+        if self.share_count is not None:
+            note.share_count = self.share_count
+        if self.upload_time:
+            note.upload_time = self.upload_time
+        if self.video_addr:
+            note.video_addr = self.video_addr
+        if self.image_list:
+            # Only replace the stored list if the new one is longer (list API
+            # returns just the cover) or the stored one is cover-only
+            old_list = json_loads(note.image_list) if note.image_list else []
+            if len(self.image_list) > len(old_list) or len(old_list) <= 1:
+                note.image_list = json_dumps(self.image_list)
+        if self.tags:
+            note.tags = json_dumps(self.tags)
+        if self.ip_location:
+            note.ip_location = self.ip_location
+        if self.cover_remote:
+            note.cover_remote = self.cover_remote
+        if self.xsec_token:
+            note.xsec_token = self.xsec_token
+        note.last_updated = now
+
+    def to_mapping(self, now: datetime) -> Dict[str, Any]:
+        """Column mapping for inserting a new Note.
+
+        Args:
+            now: Timestamp for last_updated
+
+        Returns:
+            Dict keyed by Note column name
+        """
+        return {
+            'note_id': self.note_id,
+            'user_id': self.user_id,
+            'nickname': self.nickname,
+            'avatar': self.avatar,
+            'title': self.title,
+            'desc': self.desc or '',
+            'type': self.note_type,
+            'liked_count': self.liked_count or 0,
+            'collected_count': self.collected_count or 0,
+            'comment_count': self.comment_count or 0,
+            'share_count': self.share_count or 0,
+            'upload_time': self.upload_time or '',
+            'video_addr': self.video_addr or '',
+            'image_list': json_dumps(self.image_list) if self.image_list else '[]',
+            'tags': json_dumps(self.tags) if self.tags else '[]',
+            'ip_location': self.ip_location or '',
+            'cover_remote': self.cover_remote or '',
+            'cover_local': '',
+            'xsec_token': self.xsec_token or '',
+            'last_updated': now,
+        }
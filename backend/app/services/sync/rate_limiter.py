@@ -0,0 +1,99 @@
+"""
+Rate Limiter - Shared token bucket for outbound XHS list requests
+
+Fast sync now runs several account groups in parallel. Without a shared limit
+each group would hit XHS at its own pace, so the combined request rate grew
+with MAX_CONCURRENT_SYNCS. A single module-level token bucket caps the
+aggregate rate at 1 / SYNC_REQUEST_DELAY per second while still allowing a
+short burst after idle periods.
+"""
+import threading
+import time
+from typing import Optional
+
+from ...utils.logger import get_logger
+
+logger = get_logger('rate_limiter')
+
+
+class TokenBucket:
+    """Thread-safe token bucket using monotonic time.
+
+    Example:
+        >>> bucket = TokenBucket(rate=1.0, capacity=5)
+        >>> bucket.acquire()  # returns immediately while tokens remain
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, waiting until enough have accumulated.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+            
+        Raises:
+            ValueError: If tokens exceeds the bucket capacity (would never fill)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return now - start
+                self._cond.wait((tokens - self._tokens) / self.rate)
+
+
+# Global singleton instance
+_request_rate_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_request_rate_limiter() -> TokenBucket:
+    """Get the shared request token bucket (singleton pattern).
+
+    Rate is taken from Config.SYNC_REQUEST_DELAY (seconds per request) and
+    burst size from Config.SYNC_REQUEST_BURST.
+
+    Returns:
+        The global TokenBucket instance
+    """
+    global _request_rate_limiter
+    if _request_rate_limiter is None:
+        with _limiter_lock:
+            if _request_rate_limiter is None:
+                from ...config import Config
+                delay = max(Config.SYNC_REQUEST_DELAY, 0.01)
+                # A burst below one token could never satisfy acquire()
+                burst = max(Config.SYNC_REQUEST_BURST, 1.0)
+                _request_rate_limiter = TokenBucket(
+                    rate=1.0 / delay,
+                    capacity=burst,
+                )
+                logger.debug(
+                    f"[RateLimiter] Initialized: rate={1.0 / delay:.2f}/s, "
+                    f"burst={burst}"
+                )
+    return _request_rate_limiter
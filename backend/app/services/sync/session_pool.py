@@ -5,10 +5,12 @@ This module provides HTTP session pooling to reuse TCP connections,
 reducing latency from repeated handshakes and SSL negotiations.
 """
 import threading
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ...utils.logger import get_logger
 
@@ -37,9 +39,14 @@ class RequestSessionPool:
     _lock = threading.Lock()
     
     # Connection pool configuration
-    POOL_CONNECTIONS = 10  # Number of connection pools to cache
-    POOL_MAXSIZE = 10      # Max connections per host
+    POOL_CONNECTIONS = 20  # Number of per-host pools to cache (API host + several image CDN hosts)
+    POOL_MAXSIZE = 32      # Max connections per host (shared by API calls and media downloads)
     MAX_RETRIES = 3        # Automatic retries on connection errors
+    RETRY_BACKOFF = 0.3    # Backoff factor between retries (0.3s, 0.6s, 1.2s)
+    # Transient upstream errors retried for idempotent requests. 429 is left out:
+    # rate limiting is handled by AdaptiveDelayManager, and a sub-second retry
+    # would only deepen the block.
+    RETRY_STATUS_FORCELIST = (500, 502, 503, 504)
     
     def __new__(cls):
         if cls._instance is None:
@@ -60,11 +67,19 @@ class RequestSessionPool:
         adapter = HTTPAdapter(
             pool_connections=self.POOL_CONNECTIONS,
             pool_maxsize=self.POOL_MAXSIZE,
-            max_retries=self.MAX_RETRIES,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=self.RETRY_BACKOFF,
+                status_forcelist=self.RETRY_STATUS_FORCELIST,
+                raise_on_status=False
+            ),
             pool_block=False
         )
         self._session.mount('http://', adapter)
         self._session.mount('https://', adapter)
+        # The session is shared by every account: callers pass cookies per
+        # request, so response cookies must not be kept and sent for others
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
         
         # Statistics
         self._stats = {'requests': 0, 'errors': 0}
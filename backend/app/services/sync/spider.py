@@ -0,0 +1,172 @@
+"""
+Spider Loader - Lazy access to the Spider_XHS package
+
+Spider_XHS pulls in its whole import graph (PyExecJS, JS signing runtime,
+request helpers) on import. Importing it at module level made every app start
+pay for it, including processes and endpoints that never talk to XHS. The
+package is now imported on first use and the result is cached.
+"""
+import os
+import sys
+import threading
+from types import ModuleType, SimpleNamespace
+from typing import Optional
+
+import requests
+
+from ...utils.logger import get_logger
+
+logger = get_logger('spider')
+
+# Add Spider_XHS to sys.path for its internal imports (cheap, no module import)
+_spider_xhs_path = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+    'Spider_XHS'
+)
+if _spider_xhs_path not in sys.path:
+    sys.path.insert(0, _spider_xhs_path)
+
+# Cached import result: None = not loaded yet, False = unavailable
+_spider = None
+_spider_lock = threading.Lock()
+
+# Shared XHS_Apis / Data_Spider instances
+_xhs_apis = None
+_data_spider = None
+
+
+def load_spider() -> Optional[SimpleNamespace]:
+    """Import Spider_XHS on first use.
+
+    Returns:
+        Namespace with XHS_Apis, Data_Spider, get_common_headers and
+        handle_note_info, or None if Spider_XHS is not available
+    """
+    global _spider
+    if _spider is None:
+        with _spider_lock:
+            if _spider is None:
+                try:
+                    from Spider_XHS.xhs_utils.xhs_util import get_common_headers
+                    from Spider_XHS.xhs_utils.data_util import handle_note_info
+                    from Spider_XHS.main import Data_Spider
+                    from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
+                    _spider = SimpleNamespace(
+                        XHS_Apis=XHS_Apis,
+                        Data_Spider=Data_Spider,
+                        get_common_headers=get_common_headers,
+                        handle_note_info=handle_note_info,
+                    )
+                except ImportError as e:
+                    logger.warning(f"Spider_XHS not available: {e}")
+                    _spider = False
+    return _spider or None
+
+
+def is_spider_available() -> bool:
+    """Check whether Spider_XHS can be imported (imports it on first call)."""
+    return load_spider() is not None
+
+
+def get_xhs_apis():
+    """Get the shared XHS_Apis instance (created on first use).
+
+    XHS_Apis keeps no per-request state (cookies are passed to every call),
+    so sync and API handlers share one instance instead of rebuilding it.
+    Its requests are routed through the pooled keep-alive session (see
+    _use_pooled_session) so XHS requests reuse connections.
+
+    Raises:
+        ImportError: If Spider_XHS is not available
+    """
+    global _xhs_apis
+    if _xhs_apis is None:
+        spider = load_spider()
+        if spider is None:
+            raise ImportError("Spider_XHS module not available")
+        with _spider_lock:
+            if _xhs_apis is None:
+                apis = spider.XHS_Apis()
+                if not _use_pooled_session(apis):
+                    logger.warning("XHS_Apis: no session or module-level requests found, "
+                                   "XHS requests are not pooled")
+                _xhs_apis = apis
+    return _xhs_apis
+
+
+def get_data_spider():
+    """Get the shared Data_Spider instance (created on first use).
+
+    Data_Spider wraps its own XHS_Apis; it is pointed at the shared instance
+    (whose requests already go through the pooled session) so deep sync
+    detail requests use the same keep-alive connections.
+
+    Raises:
+        ImportError: If Spider_XHS is not available
+    """
+    global _data_spider
+    if _data_spider is None:
+        spider = load_spider()
+        if spider is None:
+            raise ImportError("Spider_XHS module not available")
+        xhs_apis = get_xhs_apis()
+        with _spider_lock:
+            if _data_spider is None:
+                data_spider = spider.Data_Spider()
+                shared_apis = hasattr(data_spider, 'xhs_apis')
+                if shared_apis:
+                    data_spider.xhs_apis = xhs_apis
+                # Also covers direct requests calls made by Data_Spider itself
+                if not _use_pooled_session(data_spider) and not shared_apis:
+                    logger.warning("Data_Spider: no xhs_apis, session or module-level "
+                                   "requests found, detail requests are not pooled")
+                _data_spider = data_spider
+    return _data_spider
+
+
+class _PooledRequests:
+    """Stand-in for the ``requests`` module inside Spider_XHS modules.
+
+    Spider_XHS calls module-level ``requests.get/post``, which opens a new
+    connection per call. get/post/request are sent through the pooled
+    keep-alive session instead; every other attribute (exceptions, utils,
+    ...) is the real requests module.
+    """
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    @staticmethod
+    def request(method, url, **kwargs):
+        from .session_pool import get_request_session_pool
+        return get_request_session_pool().session.request(method, url, **kwargs)
+
+    def get(self, url, params=None, **kwargs):
+        return self.request('GET', url, params=params, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+
+def _use_pooled_session(obj) -> bool:
+    """Route obj's HTTP calls through the pooled keep-alive session.
+
+    Uses obj.session if it has one; otherwise replaces the ``requests`` name
+    in the module that defines obj's class.
+
+    Returns:
+        True if the pooled session was injected
+    """
+    if hasattr(obj, 'session'):
+        from .session_pool import get_request_session_pool
+        obj.session = get_request_session_pool().session
+        return True
+
+    module = sys.modules.get(type(obj).__module__)
+    current = getattr(module, 'requests', None)
+    if isinstance(current, _PooledRequests):
+        return True
+    if isinstance(current, ModuleType) and current is requests:
+        module.requests = _PooledRequests()
+        return True
+    return False
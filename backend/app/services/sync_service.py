@@ -6,28 +6,26 @@ This module has been refactored to use modular components:
 - sync.session_pool: HTTP connection pooling
 - sync.log_collector: Sync log collection
 - sync.media_queue: Async media downloading
+- sync.spider: Lazy Spider_XHS loading
 """
-import json
 import os
-import sys
+import queue
 import time
 import random
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import List, Optional, Set, Dict, Any, Tuple
+from types import SimpleNamespace
+from typing import Iterable, List, Optional, Set, Dict, Any, Tuple
 from urllib.parse import urlparse
 
 from flask import current_app
 
-# Add Spider_XHS to sys.path for internal imports
-_spider_xhs_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Spider_XHS')
-if _spider_xhs_path not in sys.path:
-    sys.path.insert(0, _spider_xhs_path)
-
 from ..extensions import db
 from ..models import Account, Note, Cookie
 from ..utils.logger import get_logger
+from ..utils.json_utils import json_dumps, json_loads
+from ..utils.file_utils import file_size
 from ..config import Config
 from .sync_log_broadcaster import sync_log_broadcaster
 
@@ -36,20 +34,10 @@ from .sync.delay_manager import AdaptiveDelayManager, get_adaptive_delay_manager
 from .sync.session_pool import RequestSessionPool, get_request_session_pool
 from .sync.log_collector import SyncLogCollector
 from .sync.media_queue import MediaDownloadQueue, get_media_download_queue
-
-# Spider_XHS imports
-try:
-    from Spider_XHS.xhs_utils.xhs_util import get_common_headers
-    from Spider_XHS.xhs_utils.data_util import handle_note_info
-    from Spider_XHS.main import Data_Spider
-    from Spider_XHS.apis.xhs_pc_apis import XHS_Apis
-    SPIDER_AVAILABLE = True
-except ImportError as e:
-    SPIDER_AVAILABLE = False
-    get_common_headers = None
-    handle_note_info = None
-    Data_Spider = None
-    XHS_Apis = None
+# Spider_XHS is imported lazily on first sync (also sets up sys.path for it)
+from .sync.spider import load_spider, is_spider_available, get_xhs_apis, get_data_spider
+from .sync.note_data import NoteData
+from .sync.rate_limiter import get_request_rate_limiter
 
 # Get logger
 logger = get_logger('sync')
@@ -74,12 +62,36 @@ class SyncService:
     _rate_limit_counter: int = 0
     _rate_limit_lock = threading.Lock()
     
+    # Persistent sync worker: jobs are (account_ids, sync_mode, generation)
+    _sync_queue: 'queue.Queue' = queue.Queue()
+    _queued_ids: Set[int] = set()
+    _queue_lock = threading.Lock()
+    _worker_thread: Optional[threading.Thread] = None
+    # Bumped by stop_sync(); jobs enqueued before a stop are discarded
+    _stop_generation: int = 0
+    
     # Heartbeat timeout (seconds) - tasks without heartbeat are considered stale
     HEARTBEAT_TIMEOUT = 300  # 5 minutes
     
     # Maximum concurrent image downloads per note
     MAX_CONCURRENT_DOWNLOADS = 5
     
+    # Worker threads for the deep-sync local media pre-scan (filesystem-bound)
+    MEDIA_SCAN_WORKERS = 8
+    
+    # Notes per page when loading existing notes during account sync
+    NOTE_PAGE_SIZE = 200
+    
+    # Fast-sync notes per bulk write transaction (one executemany + commit)
+    FAST_SYNC_BATCH_SIZE = 200
+    
+    # Note upsert statements by dialect name (see _get_note_upsert)
+    _note_upsert_stmts: Dict[str, Any] = {}
+    
+    # Commit progress after this many notes or seconds, whichever comes first
+    PROGRESS_FLUSH_NOTES = 10
+    PROGRESS_FLUSH_INTERVAL = 2.0
+    
     @staticmethod
     def _update_heartbeat(account_id: int) -> None:
         """Update account sync heartbeat time."""
@@ -313,6 +325,12 @@ class SyncService:
                 SyncService._rate_limit_counter = max(0, SyncService._rate_limit_counter - 1)
         get_adaptive_delay_manager().record_success()
     
+    @staticmethod
+    def _invalidate_accounts_cache() -> None:
+        """Drop the cached GET /accounts list after progress/status commits."""
+        from ..api.accounts import invalidate_accounts_cache
+        invalidate_accounts_cache()
+    
     @staticmethod
     def _mark_accounts_failed(account_ids: Set[int], message: str) -> None:
         """Mark accounts as failed to prevent UI stuck in 'preparing' state."""
@@ -333,10 +351,27 @@ class SyncService:
             db.session.rollback()
     
     @staticmethod
-    def stop_sync() -> None:
-        """Stop the current sync task."""
+    def stop_sync() -> Set[int]:
+        """Stop the current sync task and discard queued jobs.
+        
+        Returns:
+            IDs of queued accounts that were dropped without being synced
+        """
         logger.info("Stopping sync task...")
-        SyncService._stop_event.set()
+        with SyncService._queue_lock:
+            SyncService._stop_generation += 1
+            SyncService._stop_event.set()
+            dropped = set(SyncService._queued_ids)
+            SyncService._queued_ids.clear()
+            while True:
+                try:
+                    SyncService._sync_queue.get_nowait()
+                    SyncService._sync_queue.task_done()
+                except queue.Empty:
+                    break
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} queued accounts")
+        return dropped
 
     @staticmethod
     def _is_media_missing(note: Note) -> bool:
@@ -349,7 +384,7 @@ class SyncService:
             if not note.cover_local:
                 return True
             cover_path = os.path.join(Config.MEDIA_PATH, os.path.basename(note.cover_local))
-            if not os.path.exists(cover_path) or os.path.getsize(cover_path) < 1024:
+            if file_size(cover_path) < 1024:
                 return True
                 
             # Check note media directory
@@ -360,7 +395,7 @@ class SyncService:
             # For image notes, check if images exist
             if note.type in ['图集', 'normal']:
                 try:
-                    img_list = json.loads(note.image_list) if note.image_list else []
+                    img_list = json_loads(note.image_list) if note.image_list else []
                     if len(img_list) > 0:
                         files = [f for f in os.listdir(note_dir) 
                                 if f.endswith('.jpg') and os.path.getsize(os.path.join(note_dir, f)) > 1024]
@@ -376,11 +411,15 @@ class SyncService:
         return False
 
     @staticmethod
-    def _get_missing_required_fields(note: Note) -> List[str]:
+    def _get_missing_required_fields(note: Note, media_missing: Optional[bool] = None) -> List[str]:
         """Get list of missing required fields for a note.
         
         In deep sync mode, if any of these fields are missing, we need to
         fetch detail page to refresh all data.
+        
+        Args:
+            note: Note to check
+            media_missing: Pre-computed _is_media_missing result, checked here if None
         """
         if not note:
             return ['note']
@@ -425,18 +464,75 @@ class SyncService:
                 missing_fields.append('video_addr')
         else:
             try:
-                image_list = json.loads(note.image_list) if note.image_list else []
+                image_list = json_loads(note.image_list) if note.image_list else []
             except Exception:
                 image_list = []
             if len(image_list) <= 1:
                 missing_fields.append('image_list')
 
         # Local media files
-        if SyncService._is_media_missing(note):
+        if media_missing is None:
+            media_missing = SyncService._is_media_missing(note)
+        if media_missing:
             missing_fields.append('local_media')
 
         return missing_fields
 
+    @staticmethod
+    def _load_existing_notes(
+        note_ids: List[str], sync_mode: str
+    ) -> Tuple[Dict[str, Note], Dict[str, List[str]]]:
+        """Load existing notes for one page of the note list.
+        
+        Args:
+            note_ids: Note IDs on the page
+            sync_mode: 'fast' or 'deep'; deep also pre-scans missing fields
+        
+        Returns:
+            Tuple of (note_id -> Note cache, note_id -> missing fields)
+        """
+        existing = Note.query.filter(Note.note_id.in_(note_ids)).all()
+        cache = {n.note_id: n for n in existing}
+        logger.debug(f"[Cache] Pre-loaded {len(cache)}/{len(note_ids)} existing notes")
+        
+        missing_fields = {}
+        if sync_mode == 'deep':
+            missing_fields = SyncService._scan_missing_fields(cache.values())
+        return cache, missing_fields
+    
+    @staticmethod
+    def _scan_missing_fields(notes: Iterable[Note]) -> Dict[str, List[str]]:
+        """Compute missing required fields for many notes at once.
+        
+        The local media check is filesystem-bound (stat/listdir per note), so
+        it runs on a small thread pool over plain snapshots of the ORM objects;
+        field checks stay on the calling thread. Detail requests themselves
+        remain sequential to respect the anti-crawl pacing.
+        
+        Returns:
+            Dict of note_id -> missing field list
+        """
+        notes = list(notes)
+        if not notes:
+            return {}
+        
+        snapshots = [
+            SimpleNamespace(
+                note_id=n.note_id,
+                cover_local=n.cover_local,
+                type=n.type,
+                image_list=n.image_list,
+            )
+            for n in notes
+        ]
+        with ThreadPoolExecutor(max_workers=SyncService.MEDIA_SCAN_WORKERS) as executor:
+            media_missing = list(executor.map(SyncService._is_media_missing, snapshots))
+        
+        return {
+            note.note_id: SyncService._get_missing_required_fields(note, media_missing=missing)
+            for note, missing in zip(notes, media_missing)
+        }
+
     @staticmethod
     def _handle_auth_error(msg: str) -> bool:
         """Check if error is auth-related and mark Cookie as invalid."""
@@ -477,16 +573,34 @@ class SyncService:
         return any(keyword in msg_lower for keyword in tokens)
 
     @staticmethod
-    def _fetch_user_xsec_token(user_id: str, xhs_apis, cookie_str: str) -> str:
-        """Dynamically fetch user's xsec_token via search."""
-        if not user_id or not SPIDER_AVAILABLE:
+    def _fetch_user_xsec_token(
+        user_id: str,
+        xhs_apis,
+        cookie_str: str,
+        user_info_cache: Optional[Dict[str, Dict]] = None
+    ) -> str:
+        """Dynamically fetch user's xsec_token via search.
+        
+        Args:
+            user_id: XHS user ID
+            xhs_apis: XHS_Apis instance
+            cookie_str: Cookie string
+            user_info_cache: Optional {user_id: get_user_info response}; reused
+                if present, filled on a successful fetch so callers can skip
+                their own get_user_info request
+        """
+        if not user_id or not is_spider_available():
             return ''
         try:
             # Get user info for nickname
-            success_info, msg_info, user_info = xhs_apis.get_user_info(user_id, cookie_str)
-            if not success_info or not user_info:
-                logger.debug(f"Failed to get user info for {user_id}: {msg_info}")
-                return ''
+            user_info = user_info_cache.get(user_id) if user_info_cache is not None else None
+            if user_info is None:
+                success_info, msg_info, user_info = xhs_apis.get_user_info(user_id, cookie_str)
+                if not success_info or not user_info:
+                    logger.debug(f"Failed to get user info for {user_id}: {msg_info}")
+                    return ''
+                if user_info_cache is not None:
+                    user_info_cache[user_id] = user_info
             
             basic_info = user_info.get('data', {}).get('basic_info', {})
             nickname = basic_info.get('nickname', '')
@@ -536,38 +650,112 @@ class SyncService:
     @staticmethod
     def get_cookie_str() -> str:
         """Get valid decrypted Cookie string."""
-        cookie = Cookie.query.filter_by(is_active=True, is_valid=True).first()
-        if cookie:
-            return cookie.get_cookie_str()
-        
-        return getattr(Config, 'XHS_COOKIES', '')
+        return Cookie.get_active_cookie_str() or getattr(Config, 'XHS_COOKIES', '')
     
     @staticmethod
     def start_sync(account_ids: List[int], sync_mode: str = 'fast') -> None:
-        """Start background sync task.
+        """Queue a sync job for the background worker.
+        
+        Jobs run one after another on a single long-lived worker thread, so
+        concurrent requests cannot start overlapping syncs. Accounts that are
+        already waiting in the queue are not queued again.
         
         Args:
             account_ids: List of account IDs to sync
             sync_mode: 'fast' for quick sync, 'deep' for full sync
         """
-        from .. import create_app
-        app = create_app()
-        
-        SyncService._stop_event.clear()
-        SyncService._current_sync_mode = sync_mode
+        try:
+            app = current_app._get_current_object()
+        except RuntimeError:
+            from .. import create_app
+            app = create_app()
         
-        thread = threading.Thread(
-            target=SyncService._run_sync, 
-            args=(app, account_ids, sync_mode)
-        )
-        thread.daemon = True
-        thread.start()
+        with SyncService._queue_lock:
+            new_ids = [i for i in account_ids if i not in SyncService._queued_ids]
+            if not new_ids:
+                logger.info(f"Sync already queued for accounts: {account_ids}")
+                return
+            SyncService._queued_ids.update(new_ids)
+            SyncService._sync_queue.put((new_ids, sync_mode, SyncService._stop_generation))
+            
+            worker = SyncService._worker_thread
+            if worker is None or not worker.is_alive():
+                worker = threading.Thread(
+                    target=SyncService._sync_worker,
+                    args=(app,),
+                    name='sync-worker'
+                )
+                worker.daemon = True
+                SyncService._worker_thread = worker
+                worker.start()
         
-        logger.info(f"Sync task started: {len(account_ids)} accounts, mode: {sync_mode}")
+        logger.info(f"Sync task queued: {len(new_ids)} accounts, mode: {sync_mode}")
+    
+    @staticmethod
+    def _sync_worker(app) -> None:
+        """Worker loop: run queued sync jobs one at a time."""
+        while True:
+            account_ids, sync_mode, generation = SyncService._sync_queue.get()
+            try:
+                with SyncService._queue_lock:
+                    if generation != SyncService._stop_generation:
+                        # Stopped after this job was queued
+                        continue
+                    SyncService._queued_ids.difference_update(account_ids)
+                    SyncService._stop_event.clear()
+                    SyncService._current_sync_mode = sync_mode
+                
+                logger.info(f"Sync task started: {len(account_ids)} accounts, mode: {sync_mode}")
+                SyncService._run_sync(app, account_ids, sync_mode)
+            except Exception:
+                # Keep the worker alive: jobs queued behind this one would
+                # otherwise wait forever
+                logger.exception(f"[SyncWorker] Sync job failed: {account_ids}")
+            finally:
+                with SyncService._queue_lock:
+                    SyncService._current_sync_mode = 'fast'
+                SyncService._sync_queue.task_done()
     
     @staticmethod
     def _run_sync(app, account_ids: List[int], sync_mode: str) -> None:
-        """Execute sync in background thread with top-level error handling."""
+        """Execute a sync job, running fast-sync accounts in parallel.
+        
+        Fast sync only calls the list API once per account, so accounts are
+        split across up to MAX_CONCURRENT_SYNCS threads. Deep sync stays
+        sequential: its detail requests are paced by the adaptive delay.
+        """
+        workers = min(Config.MAX_CONCURRENT_SYNCS, len(account_ids))
+        if sync_mode != 'fast' or workers <= 1:
+            SyncService._run_sync_group(app, account_ids, sync_mode)
+            return
+        
+        groups = [account_ids[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sync-fast') as executor:
+            futures = [
+                executor.submit(SyncService._run_sync_group, app, group, sync_mode)
+                for group in groups
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    logger.exception("[FastSync] Sync group failed")
+        
+        # A group that hit an auth error only marks its own accounts; the
+        # others stop at the next account and leave theirs pending
+        if SyncService._stop_event.is_set():
+            with app.app_context():
+                pending_ids = {
+                    acc_id for (acc_id,) in db.session.query(Account.id).filter(
+                        Account.id.in_(account_ids),
+                        Account.status == 'pending'
+                    )
+                }
+                SyncService._mark_accounts_failed(pending_ids, "Sync stopped")
+    
+    @staticmethod
+    def _run_sync_group(app, account_ids: List[int], sync_mode: str) -> None:
+        """Sync a group of accounts in its own app context with top-level error handling."""
         with app.app_context():
             try:
                 SyncService._sync_accounts(account_ids, sync_mode)
@@ -595,7 +783,8 @@ class SyncService:
     @staticmethod
     def _sync_accounts(account_ids: List[int], sync_mode: str) -> None:
         """Main sync logic for account notes."""
-        if not SPIDER_AVAILABLE:
+        spider = load_spider()
+        if spider is None:
             logger.error("Spider_XHS module not available")
             Account.query.filter(Account.id.in_(account_ids)).update(
                 {'status': 'failed', 'error_message': 'Spider module not available'},
@@ -620,8 +809,10 @@ class SyncService:
             return
         
         try:
-            xhs_apis = XHS_Apis()
-            data_spider = Data_Spider()
+            xhs_apis = get_xhs_apis()
+            data_spider = get_data_spider()
+            # Shared across parallel sync groups to cap the aggregate list request rate
+            rate_limiter = get_request_rate_limiter()
         except Exception as e:
             error_msg = f"Failed to initialize API: {e}"
             logger.error(f"Failed to initialize XHS APIs: {e}")
@@ -670,9 +861,10 @@ class SyncService:
                     account.sync_logs = None
                 db.session.commit()
                 
-                # Get user xsec_token
+                # Get user xsec_token (the user info it fetches is reused below)
                 warning_msg = None
-                xsec_token = SyncService._fetch_user_xsec_token(account.user_id, xhs_apis, cookie_str)
+                user_info_cache = {}
+                xsec_token = SyncService._fetch_user_xsec_token(account.user_id, xhs_apis, cookie_str, user_info_cache)
                 
                 if xsec_token:
                     user_url = f'https://www.xiaohongshu.com/user/profile/{account.user_id}?xsec_token={xsec_token}&xsec_source=pc_search'
@@ -690,23 +882,26 @@ class SyncService:
                         continue
                 
                 # Get all notes
+                rate_limiter.acquire()
                 success, msg, all_note_info = xhs_apis.get_user_all_notes(user_url, cookie_str)
                 
                 # Retry with refreshed token if needed
                 if not success and sync_mode == 'deep' and SyncService._is_xsec_token_error(msg):
-                    new_token = SyncService._fetch_user_xsec_token(account.user_id, xhs_apis, cookie_str)
+                    new_token = SyncService._fetch_user_xsec_token(account.user_id, xhs_apis, cookie_str, user_info_cache)
                     if new_token and new_token != xsec_token:
                         xsec_token = new_token
                         user_url = f'https://www.xiaohongshu.com/user/profile/{account.user_id}?xsec_token={xsec_token}&xsec_source=pc_search'
+                        rate_limiter.acquire()
                         success, msg, all_note_info = xhs_apis.get_user_all_notes(user_url, cookie_str)
                 
                 # Retry if empty list
                 if success and not all_note_info:
                     logger.debug(f"Got 0 notes for {account.user_id}, refreshing token...")
-                    new_token = SyncService._fetch_user_xsec_token(account.user_id, xhs_apis, cookie_str)
+                    new_token = SyncService._fetch_user_xsec_token(account.user_id, xhs_apis, cookie_str, user_info_cache)
                     if new_token and new_token != xsec_token:
                         xsec_token = new_token
                         user_url = f'https://www.xiaohongshu.com/user/profile/{account.user_id}?xsec_token={xsec_token}&xsec_source=pc_search'
+                        rate_limiter.acquire()
                         success_retry, msg_retry, all_note_info_retry = xhs_apis.get_user_all_notes(user_url, cookie_str)
                         if success_retry and all_note_info_retry:
                             success, msg, all_note_info = success_retry, msg_retry, all_note_info_retry
@@ -715,7 +910,7 @@ class SyncService:
                     if SyncService._handle_auth_error(msg):
                         error_msg = f"Cookie expired, please re-login. Error: {msg}"
                         auth_error_msg = error_msg
-                        SyncService.stop_sync()
+                        remaining_ids |= SyncService.stop_sync()
                         SyncService._mark_accounts_failed(remaining_ids, error_msg)
                     else:
                         error_msg = f"Failed to get notes: {msg}"
@@ -745,11 +940,15 @@ class SyncService:
 
                 # Update user info
                 try:
-                    success_info, msg_info, user_info_res = xhs_apis.get_user_info(account.user_id, cookie_str)
+                    user_info_res = user_info_cache.get(account.user_id)
+                    if user_info_res is not None:
+                        success_info, msg_info = True, ''
+                    else:
+                        success_info, msg_info, user_info_res = xhs_apis.get_user_info(account.user_id, cookie_str)
                     
                     if not success_info and SyncService._handle_auth_error(msg_info):
                         auth_error_msg = f"Cookie expired. Error: {msg_info}"
-                        SyncService.stop_sync()
+                        remaining_ids |= SyncService.stop_sync()
                         SyncService._mark_accounts_failed(remaining_ids, auth_error_msg)
                     
                     if success_info and user_info_res and user_info_res.get('data'):
@@ -785,21 +984,35 @@ class SyncService:
                 if sync_log:
                     sync_log.set_total(total)
                 
-                # Pre-cache existing notes
-                all_note_ids = [n.get('note_id') or n.get('id') for n in all_note_info]
-                existing_notes_query = Note.query.filter(Note.note_id.in_(all_note_ids)).all()
-                existing_notes_cache = {n.note_id: n for n in existing_notes_query}
-                existing_note_ids_cache = set(existing_notes_cache.keys())
-                logger.debug(f"[Cache] Pre-loaded {len(existing_note_ids_cache)}/{len(all_note_ids)} existing notes")
-                
                 # Batch buffer for fast sync
-                FAST_SYNC_BATCH_SIZE = 20
                 fast_sync_batch = []
+                existing_notes_cache = {}
+                existing_note_ids_cache = set()
+                missing_fields_cache = {}
+                last_flush_n = 0
+                last_flush_ts = time.time()
                 
                 for idx, simple_note in enumerate(all_note_info):
                     if SyncService._stop_event.is_set():
                         break
 
+                    # Load existing notes one page at a time so memory stays
+                    # O(page) and the first detail fetch does not wait for all
+                    if idx % SyncService.NOTE_PAGE_SIZE == 0:
+                        if fast_sync_batch:
+                            try:
+                                SyncService._bulk_save_notes(
+                                    fast_sync_batch, existing_note_ids_cache, existing_notes_cache
+                                )
+                            except Exception as e:
+                                logger.error(f"[FastSync] Batch save failed: {e}")
+                            fast_sync_batch = []
+                        page = all_note_info[idx:idx + SyncService.NOTE_PAGE_SIZE]
+                        existing_notes_cache, missing_fields_cache = SyncService._load_existing_notes(
+                            [n.get('note_id') or n.get('id') for n in page], sync_mode
+                        )
+                        existing_note_ids_cache = set(existing_notes_cache.keys())
+
                     note_id = simple_note.get('note_id') or simple_note.get('id')
                     note_xsec_token = simple_note.get('xsec_token', '')
                     if note_xsec_token:
@@ -815,7 +1028,9 @@ class SyncService:
                         if not existing_note:
                             need_fetch_detail = True
                         else:
-                            missing_fields = SyncService._get_missing_required_fields(existing_note)
+                            missing_fields = missing_fields_cache.get(note_id)
+                            if missing_fields is None:
+                                missing_fields = SyncService._get_missing_required_fields(existing_note)
                             if missing_fields:
                                 need_fetch_detail = True
                                 logger.debug(f"Note {note_id} missing fields: {missing_fields}")
@@ -837,18 +1052,9 @@ class SyncService:
                                     if sync_log:
                                         sync_log.record_skipped()
                             else:
+                                # Written together with the progress update below
                                 fast_sync_batch.append(cleaned_data)
                                 
-                                if len(fast_sync_batch) >= FAST_SYNC_BATCH_SIZE:
-                                    try:
-                                        inserted, updated = SyncService._bulk_save_notes(
-                                            fast_sync_batch, existing_note_ids_cache, existing_notes_cache
-                                        )
-                                        logger.debug(f"[FastSync] Batch saved {len(fast_sync_batch)}: {inserted} new, {updated} updated")
-                                    except Exception as e:
-                                        logger.error(f"[FastSync] Batch save failed: {e}")
-                                    fast_sync_batch = []
-                                
                         except Exception as e:
                             logger.warning(f"Error quick updating note {note_id}: {e}")
                     else:
@@ -908,7 +1114,7 @@ class SyncService:
                                             message=str(msg)
                                         )
                                         sync_log.save_to_db()
-                                    SyncService.stop_sync()
+                                    remaining_ids |= SyncService.stop_sync()
                                     account.status = 'failed'
                                     account.error_message = auth_error_msg
                                     db.session.commit()
@@ -935,7 +1141,10 @@ class SyncService:
                             if success and note_info:
                                 try:
                                     note_info['xsec_token'] = note_xsec_token
-                                    SyncService._save_note(note_info, download_media=True, auto_commit=False)
+                                    SyncService._save_note(
+                                        note_info, download_media=True, auto_commit=False,
+                                        existing_notes_cache=existing_notes_cache
+                                    )
                                     detail_saved = True
                                     SyncService._record_success()
                                     if sync_log:
@@ -982,7 +1191,10 @@ class SyncService:
                                     simple_note['xsec_token'] = note_xsec_token
                                 # Use list note converter instead of handle_note_info (which expects detail format)
                                 cleaned_data = SyncService._convert_list_note(simple_note, user_id=account.user_id)
-                                SyncService._save_note(cleaned_data, download_media=False, auto_commit=False)
+                                SyncService._save_note(
+                                    cleaned_data, download_media=False, auto_commit=False,
+                                    existing_notes_cache=existing_notes_cache
+                                )
                             except Exception as e:
                                 logger.warning(f"Error saving note {note_id} with list data: {e}")
                         
@@ -992,10 +1204,37 @@ class SyncService:
                     account.loaded_msgs = idx + 1
                     account.progress = int(((idx + 1) / total) * 100) if total > 0 else 100
                     
-                    # Batch commit every 5 notes
-                    if (idx + 1) % 5 == 0 or idx == total - 1:
+                    # Batch commit every PROGRESS_FLUSH_NOTES notes or PROGRESS_FLUSH_INTERVAL seconds,
+                    # or when the fast-sync batch is full
+                    flush_batch = bool(fast_sync_batch) and (
+                        len(fast_sync_batch) >= SyncService.FAST_SYNC_BATCH_SIZE or idx == total - 1
+                    )
+                    if (flush_batch
+                            or idx + 1 - last_flush_n >= SyncService.PROGRESS_FLUSH_NOTES
+                            or time.time() - last_flush_ts >= SyncService.PROGRESS_FLUSH_INTERVAL
+                            or idx == total - 1):
+                        last_flush_n = idx + 1
+                        last_flush_ts = time.time()
                         account.sync_heartbeat = datetime.utcnow()
-                        db.session.commit()
+                        if flush_batch:
+                            # One transaction for the note batch and the progress update
+                            try:
+                                inserted, updated = SyncService._bulk_save_notes(
+                                    fast_sync_batch, existing_note_ids_cache, existing_notes_cache
+                                )
+                                logger.debug(f"[FastSync] Batch saved {len(fast_sync_batch)}: {inserted} new, {updated} updated")
+                            except Exception as e:
+                                logger.error(f"[FastSync] Batch save failed: {e}")
+                                # The rollback also discarded the progress update;
+                                # re-apply it so the heartbeat does not go stale
+                                account.loaded_msgs = idx + 1
+                                account.progress = int(((idx + 1) / total) * 100) if total > 0 else 100
+                                account.sync_heartbeat = datetime.utcnow()
+                                db.session.commit()
+                            fast_sync_batch = []
+                        else:
+                            db.session.commit()
+                        SyncService._invalidate_accounts_cache()
                         
                         sync_log_broadcaster.broadcast_progress(
                             account_id=acc_id,
@@ -1005,7 +1244,7 @@ class SyncService:
                             total_msgs=total
                         )
                     
-                # Save remaining batch
+                # Save remaining batch (loop stopped early)
                 if sync_mode == 'fast' and fast_sync_batch:
                     try:
                         inserted, updated = SyncService._bulk_save_notes(
@@ -1030,7 +1269,7 @@ class SyncService:
                     
                     if sync_log:
                         logs_data = sync_log.finalize()
-                        account.sync_logs = json.dumps(logs_data, ensure_ascii=False)
+                        account.sync_logs = json_dumps(logs_data)
                         
                         summary = logs_data.get('summary', {})
                         issues_count = sum([
@@ -1059,6 +1298,7 @@ class SyncService:
                         sync_log.save_to_db()
                 
                 db.session.commit()
+                SyncService._invalidate_accounts_cache()
                 
             except Exception as e:
                 logger.error(f"Error syncing account {acc_id}: {e}")
@@ -1080,7 +1320,7 @@ class SyncService:
                                 message=f"Sync error: {str(e)}"
                             )
                             logs_data = sync_log.finalize()
-                            account.sync_logs = json.dumps(logs_data, ensure_ascii=False)
+                            account.sync_logs = json_dumps(logs_data)
                         db.session.commit()
                 except Exception as inner_e:
                     logger.error(f"Error updating account status: {inner_e}")
@@ -1119,93 +1359,36 @@ class SyncService:
             cover_tasks = []
             
             for note_data in notes_data_list:
-                note_id = note_data.get('note_id')
+                data = NoteData.from_dict(note_data)
+                note_id = data.note_id
                 if not note_id:
                     continue
                 
-                # Calculate cover URL
-                cover_remote = note_data.get('cover_remote') or note_data.get('video_cover')
-                if not cover_remote:
-                    imgs = note_data.get('image_list') or []
-                    cover_remote = imgs[0] if imgs else None
-                
-                if cover_remote:
-                    cover_tasks.append((cover_remote, note_id))
+                if data.cover_remote:
+                    cover_tasks.append((data.cover_remote, note_id))
                 
                 if note_id in existing_note_ids:
                     # Update existing
                     note = existing_notes_cache.get(note_id)
                     if note:
-                        note.nickname = note_data['nickname']
-                        note.avatar = note_data['avatar']
-                        note.title = note_data['title']
-                        if note_data['desc']:
-                            note.desc = note_data['desc']
-                        note.type = note_data['note_type']
-                        
-                        if note_data['liked_count'] is not None:
-                            note.liked_count = note_data['liked_count']
-                        if note_data['collected_count'] is not None:
-                            note.collected_count = note_data['collected_count']
-                        if note_data['comment_count'] is not None:
-                            note.comment_count = note_data['comment_count']
-                        if note_data['share_count'] is not None:
-                            note.share_count = note_data['share_count']
-                        if note_data['upload_time']:
-                            note.upload_time = note_data['upload_time']
-                        if note_data['video_addr']:
-                            note.video_addr = note_data['video_addr']
-                        if note_data['image_list']:
-                            new_count = len(note_data['image_list'])
-                            old_list = json.loads(note.image_list) if note.image_list else []
-                            if new_count > len(old_list) or len(old_list) <= 1:
-                                note.image_list = json.dumps(note_data['image_list'])
-                        if note_data['tags']:
-                            note.tags = json.dumps(note_data['tags'])
-                        if note_data['ip_location']:
-                            note.ip_location = note_data['ip_location']
-                        if cover_remote:
-                            note.cover_remote = cover_remote
-                        if note_data.get('xsec_token'):
-                            note.xsec_token = note_data['xsec_token']
-                        note.last_updated = now
+                        data.apply_to(note, now)
                         update_count += 1
                 else:
-                    # Insert new
-                    mapping = {
-                        'note_id': note_id,
-                        'user_id': note_data['user_id'],
-                        'nickname': note_data['nickname'],
-                        'avatar': note_data['avatar'],
-                        'title': note_data['title'],
-                        'desc': note_data['desc'] or '',
-                        'type': note_data['note_type'],
-                        'liked_count': note_data['liked_count'] or 0,
-                        'collected_count': note_data['collected_count'] or 0,
-                        'comment_count': note_data['comment_count'] or 0,
-                        'share_count': note_data['share_count'] or 0,
-                        'upload_time': note_data['upload_time'] or '',
-                        'video_addr': note_data['video_addr'] or '',
-                        'image_list': json.dumps(note_data['image_list']) if note_data['image_list'] else '[]',
-                        'tags': json.dumps(note_data['tags']) if note_data['tags'] else '[]',
-                        'ip_location': note_data['ip_location'] or '',
-                        'cover_remote': cover_remote or '',
-                        'cover_local': '',
-                        'xsec_token': note_data.get('xsec_token') or '',
-                        'last_updated': now,
-                    }
-                    insert_mappings.append(mapping)
+                    # Insert new (track the id so a repeated note_id in the
+                    # same run is not inserted twice)
+                    existing_note_ids.add(note_id)
+                    insert_mappings.append(data.to_mapping(now))
             
             if insert_mappings:
-                db.session.bulk_insert_mappings(Note, insert_mappings)
+                SyncService._insert_notes(insert_mappings)
             
             db.session.commit()
             
             # Submit cover downloads to async queue
             if cover_tasks:
-                queue = get_media_download_queue()
+                media_queue = get_media_download_queue()
                 for cover_url, nid in cover_tasks:
-                    queue.submit_cover_download(cover_url, nid, callback=SyncService._update_cover_local)
+                    media_queue.submit_cover_download(cover_url, nid, callback=SyncService._update_cover_local)
             
             return len(insert_mappings), update_count
             
@@ -1215,97 +1398,139 @@ class SyncService:
             raise
     
     @staticmethod
-    def _save_note(note_data: Dict, download_media: bool = False, auto_commit: bool = True) -> None:
+    def _insert_notes(mappings: List[Dict]) -> None:
+        """Insert new notes in one executemany, upserting on note_id conflict.
+        
+        Uses INSERT ... ON CONFLICT(note_id) DO UPDATE, which updates the row
+        in place. A note inserted concurrently (e.g. by a single-account sync
+        running alongside a batch) is merged instead of failing the whole
+        batch on the primary key. Like NoteData.apply_to, blank values do not
+        overwrite stored ones.
+        """
+        stmt = SyncService._get_note_upsert(db.session.get_bind().dialect.name)
+        if stmt is None:
+            db.session.bulk_insert_mappings(Note, mappings)
+            return
+        db.session.execute(stmt, mappings)
+    
+    @staticmethod
+    def _get_note_upsert(dialect: str):
+        """Get the note upsert statement for a dialect, built once and reused.
+        
+        Returns:
+            Insert statement, or None if the dialect has no ON CONFLICT support
+        """
+        stmt = SyncService._note_upsert_stmts.get(dialect)
+        if stmt is not None:
+            return stmt
+        
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            return None
+        
+        stmt = insert(Note.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Note.__table__.c.note_id],
+            set_=SyncService._note_upsert_set(stmt, dialect)
+        )
+        SyncService._note_upsert_stmts[dialect] = stmt
+        return stmt
+    
+    @staticmethod
+    def _note_upsert_set(stmt, dialect: str) -> Dict[str, Any]:
+        """Build the ON CONFLICT DO UPDATE SET clause for notes.
+        
+        Mirrors NoteData.apply_to: blank values keep the stored ones, and
+        image_list is only replaced by a longer list or over a cover-only one.
+        """
+        from sqlalchemy import JSON, case, cast, func, or_
+        
+        table = Note.__table__
+        excluded = stmt.excluded
+        
+        def keep_blank(column: str, blank):
+            return func.coalesce(func.nullif(excluded[column], blank), table.c[column])
+        
+        def json_length(column):
+            # image_list is a Text column; PostgreSQL needs an explicit cast
+            value = func.nullif(column, '')
+            if dialect == 'postgresql':
+                value = cast(value, JSON)
+            return func.coalesce(func.json_array_length(value), 0)
+        
+        new_images = json_length(excluded.image_list)
+        old_images = json_length(table.c.image_list)
+        
+        set_ = {
+            'nickname': excluded.nickname,
+            'avatar': excluded.avatar,
+            'title': excluded.title,
+            'type': excluded.type,
+            'image_list': case(
+                (
+                    (new_images > 0) & or_(new_images > old_images, old_images <= 1),
+                    excluded.image_list
+                ),
+                else_=table.c.image_list
+            ),
+            'tags': keep_blank('tags', '[]'),
+            'last_updated': excluded.last_updated,
+        }
+        for column in ('liked_count', 'collected_count', 'comment_count', 'share_count'):
+            set_[column] = keep_blank(column, 0)
+        for column in ('desc', 'upload_time', 'video_addr', 'ip_location', 'cover_remote', 'xsec_token'):
+            set_[column] = keep_blank(column, '')
+        return set_
+    
+    @staticmethod
+    def _save_note(
+        note_data: Dict,
+        download_media: bool = False,
+        auto_commit: bool = True,
+        existing_notes_cache: Optional[Dict[str, Note]] = None
+    ) -> None:
         """Save a single note to database.
         
         Args:
             note_data: Note data dictionary
             download_media: Whether to download media files
             auto_commit: Whether to auto-commit transaction
+            existing_notes_cache: Pre-loaded {note_id: Note} for the account; when
+                given, the per-note SELECT is skipped (a note missing from it
+                is inserted with an upsert, so a repeat is merged)
         """
         try:
-            note_id = note_data.get('note_id')
+            data = NoteData.from_dict(note_data)
+            note_id = data.note_id
             if not note_id:
                 logger.debug(f"Skipping note save: note_id is empty")
                 return
-
-            # Calculate cover
-            cover_remote = note_data.get('cover_remote') or note_data.get('video_cover')
-            if not cover_remote:
-                imgs = note_data.get('image_list') or []
-                cover_remote = imgs[0] if imgs else None
+            cover_remote = data.cover_remote
             
-            note = Note.query.filter_by(note_id=note_id).first()
+            if existing_notes_cache is not None:
+                note = existing_notes_cache.get(note_id)
+            else:
+                note = Note.query.filter_by(note_id=note_id).first()
             
             if note:
                 # Update existing
-                note.nickname = note_data['nickname']
-                note.avatar = note_data['avatar']
-                note.title = note_data['title']
-                if note_data['desc']:
-                    note.desc = note_data['desc']
-                note.type = note_data['note_type']
-                
-                if note_data['liked_count'] is not None:
-                    note.liked_count = note_data['liked_count']
-                if note_data['collected_count'] is not None:
-                    note.collected_count = note_data['collected_count']
-                if note_data['comment_count'] is not None:
-                    note.comment_count = note_data['comment_count']
-                if note_data['share_count'] is not None:
-                    note.share_count = note_data['share_count']
-                if note_data['upload_time']:
-                    note.upload_time = note_data['upload_time']
-                if note_data['video_addr']:
-                    note.video_addr = note_data['video_addr']
-                if note_data['image_list']:
-                    new_count = len(note_data['image_list'])
-                    old_list = json.loads(note.image_list) if note.image_list else []
-                    if new_count > len(old_list) or len(old_list) <= 1:
-                        note.image_list = json.dumps(note_data['image_list'])
-                if note_data['tags']:
-                    note.tags = json.dumps(note_data['tags'])
-                if note_data['ip_location']:
-                    note.ip_location = note_data['ip_location']
-                if cover_remote:
-                    note.cover_remote = cover_remote
-                if note_data.get('xsec_token'):
-                    note.xsec_token = note_data['xsec_token']
-                note.last_updated = datetime.utcnow()
+                data.apply_to(note, datetime.utcnow())
             else:
-                # Create new
-                note = Note(
-                    note_id=note_id,
-                    user_id=note_data['user_id'],
-                    nickname=note_data['nickname'],
-                    avatar=note_data['avatar'],
-                    title=note_data['title'],
-                    desc=note_data['desc'] or '',
-                    type=note_data['note_type'],
-                    liked_count=note_data['liked_count'] or 0,
-                    collected_count=note_data['collected_count'] or 0,
-                    comment_count=note_data['comment_count'] or 0,
-                    share_count=note_data['share_count'] or 0,
-                    upload_time=note_data['upload_time'] or '',
-                    video_addr=note_data['video_addr'] or '',
-                    image_list=json.dumps(note_data['image_list']) if note_data['image_list'] else '[]',
-                    tags=json.dumps(note_data['tags']) if note_data['tags'] else '[]',
-                    ip_location=note_data['ip_location'] or '',
-                    cover_remote=cover_remote or '',
-                    cover_local='',
-                    xsec_token=note_data.get('xsec_token') or '',
-                )
-                db.session.add(note)
+                # Create new (upsert: a concurrent insert of the same note is merged)
+                SyncService._insert_notes([data.to_mapping(datetime.utcnow())])
             
             if auto_commit:
                 db.session.commit()
             
             # Async media download
-            queue = get_media_download_queue()
+            media_queue = get_media_download_queue()
             if cover_remote:
-                queue.submit_cover_download(cover_remote, note_id, callback=SyncService._update_cover_local)
+                media_queue.submit_cover_download(cover_remote, note_id, callback=SyncService._update_cover_local)
             if download_media:
-                queue.submit_media_download(note_id, note_data)
+                media_queue.submit_media_download(note_id, note_data)
                 
         except Exception as e:
             db.session.rollback()
@@ -1343,7 +1568,6 @@ class SyncService:
         if not remote_url:
             return None
         try:
-            Config.init_paths()
             parsed = urlparse(remote_url)
             ext = os.path.splitext(parsed.path)[1]
             if not ext or len(ext) > 5:
@@ -1351,10 +1575,11 @@ class SyncService:
             filename = f"{note_id}_cover{ext}"
             filepath = os.path.join(Config.MEDIA_PATH, filename)
             
-            if os.path.exists(filepath) and os.path.getsize(filepath) > 1024:
+            if file_size(filepath) > 1024:
                 return f"/api/media/{filename}"
             
-            headers = get_common_headers() if get_common_headers else {}
+            spider = load_spider()
+            headers = spider.get_common_headers() if spider else {}
             session_pool = get_request_session_pool()
             
             for attempt in range(3):
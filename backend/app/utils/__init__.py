@@ -5,6 +5,7 @@ from .responses import success_response, error_response, ApiResponse
 from .validators import validate_user_id, validate_ids_list
 from .crypto import CookieCrypto
 from .logger import setup_logger, get_logger
+from .json_utils import json_dumps, json_loads, OrjsonProvider
 
 __all__ = [
     'success_response',
@@ -15,5 +16,8 @@ __all__ = [
     'CookieCrypto',
     'setup_logger',
     'get_logger',
+    'json_dumps',
+    'json_loads',
+    'OrjsonProvider',
 ]
 
@@ -145,9 +145,22 @@ def encrypt_cookie(cookie_str: str) -> str:
     return get_crypto().encrypt(cookie_str)
 
 
+# 最近一次解密结果 (密文, 明文)
+# 活跃 Cookie 在同步循环和 /user/me 中被反复解密，而密文只在重新保存时才变化，
+# 因此以密文本身作为版本标识缓存明文，密文变化即自动失效
+_last_decrypted: Tuple[Optional[str], str] = (None, '')
+
+
 def decrypt_cookie(encrypted: str) -> str:
-    """解密 Cookie 字符串"""
-    return get_crypto().decrypt(encrypted)
+    """解密 Cookie 字符串（相同密文直接返回缓存结果）"""
+    global _last_decrypted
+    cached_ciphertext, cached_plaintext = _last_decrypted
+    if encrypted and encrypted == cached_ciphertext:
+        return cached_plaintext
+    
+    decrypted = get_crypto().decrypt(encrypted)
+    _last_decrypted = (encrypted, decrypted)
+    return decrypted
 
 
 class TransportCrypto:
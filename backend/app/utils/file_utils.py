@@ -0,0 +1,21 @@
+"""
+文件工具
+媒体下载/预览会频繁检查本地文件，用一次 stat 代替 exists + getsize
+"""
+import os
+
+
+def file_size(path: str) -> int:
+    """
+    获取文件大小（单次 stat，避免 exists 与 getsize 之间的竞态）
+    
+    Args:
+        path: 文件路径
+        
+    Returns:
+        文件大小（字节），文件不存在或无法访问时返回 -1
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return -1
@@ -0,0 +1,81 @@
+"""
+JSON 序列化工具
+同步过程中每条笔记都要序列化 image_list / tags，优先使用 orjson（C 实现），
+未安装时回退到标准库 json
+"""
+import json
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+# 尝试导入 orjson，如果不存在则使用标准库
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    序列化为 JSON 字符串（非 ASCII 字符原样输出）
+
+    Args:
+        obj: 可 JSON 序列化的对象
+
+    Returns:
+        JSON 字符串
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def json_loads(data: Any) -> Any:
+    """
+    解析 JSON 字符串或字节
+
+    Args:
+        data: JSON 字符串 / bytes
+
+    Returns:
+        解析后的对象
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider：jsonify 与 request.get_json 使用 orjson
+
+    键按 sort_keys 排序，datetime / dataclass 交给 Flask 默认的 default 处理，
+    与 DefaultJSONProvider 的区别仅在于非 ASCII 字符原样输出（ensure_ascii=False）；
+    调用方传入 orjson 无法等价处理的参数（缩进、自定义 default 等）时回退到标准库
+    """
+
+    ensure_ascii = False
+
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    ) if HAS_ORJSON else 0
+
+    # jsonify 在非调试模式下总会传入紧凑分隔符，orjson 输出本身即为紧凑格式
+    _COMPACT_SEPARATORS = (',', ':')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.get('separators', self._COMPACT_SEPARATORS) == self._COMPACT_SEPARATORS:
+            kwargs.pop('separators', None)
+        if kwargs or self.ensure_ascii:
+            return super().dumps(obj, **kwargs)
+        option = self._OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -3,7 +3,7 @@
 """
 import re
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any
 
 
 def validate_user_id(user_id: Any) -> Tuple[bool, Optional[str]]:
@@ -77,6 +77,26 @@ def validate_ids_list(
     return True, None, cleaned_ids
 
 
+def parse_cookie_str(cookie_str: str) -> Dict[str, str]:
+    """
+    解析 "k1=v1; k2=v2" 格式的 Cookie 字符串
+    
+    每段只用 str.partition 扫描一次，值中的 '=' 原样保留
+    
+    Args:
+        cookie_str: Cookie 字符串
+        
+    Returns:
+        {name: value} 字典，忽略不含 '=' 的片段
+    """
+    cookies = {}
+    for part in cookie_str.split(';'):
+        key, eq, value = part.partition('=')
+        if eq:
+            cookies[key.strip()] = value.strip()
+    return cookies
+
+
 def validate_cookie_str(cookie_str: Any) -> Tuple[bool, Optional[str]]:
     """
     验证 Cookie 字符串
@@ -101,10 +121,11 @@ def validate_cookie_str(cookie_str: Any) -> Tuple[bool, Optional[str]]:
     if len(cookie_str) > 10000:
         return False, 'Cookie 字符串过长'
     
-    # 检查必须的 Cookie 字段
+    # 检查必须的 Cookie 字段（按 Cookie 名匹配，而不是子串）
+    cookies = parse_cookie_str(cookie_str)
     required_fields = ['a1']
     for field in required_fields:
-        if field not in cookie_str:
+        if not cookies.get(field):
             return False, f"Cookie 缺少必要字段 '{field}'"
     
     return True, None
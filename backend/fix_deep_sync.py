@@ -31,6 +31,10 @@ from datetime import datetime
 # 添加项目路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# 维护脚本不执行启动任务（连接池预热、清理残留同步状态），
+# 否则会把正在运行的服务中的同步任务标记为失败
+os.environ.setdefault('RUN_STARTUP_TASKS', 'false')
+
 from app import create_app
 from app.extensions import db
 from app.models import Note, Account, Cookie
@@ -13,10 +13,15 @@ import requests
 # 添加项目路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# 维护脚本不执行启动任务（连接池预热、清理残留同步状态），
+# 否则会把正在运行的服务中的同步任务标记为失败
+os.environ.setdefault('RUN_STARTUP_TASKS', 'false')
+
 from app import create_app
 from app.models import Note
 from app.extensions import db
 from app.config import Config
+from app.utils.file_utils import file_size
 from Spider_XHS.xhs_utils.xhs_util import get_common_headers
 
 
@@ -109,7 +114,7 @@ def fix_missing_covers(limit=None, dry_run=False, mode='all'):
                 filepath = os.path.join(Config.MEDIA_PATH, filename)
                 
                 # 检查是否已存在
-                if os.path.exists(filepath) and os.path.getsize(filepath) > 1024:
+                if file_size(filepath) > 1024:
                     # 文件存在，只需更新数据库
                     note.cover_local = f"/api/media/{filename}"
                     if source == 'image_list' and not note.cover_remote:
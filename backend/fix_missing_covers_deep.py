@@ -20,6 +20,10 @@ from datetime import datetime
 # 添加项目路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# 维护脚本不执行启动任务（连接池预热、清理残留同步状态），
+# 否则会把正在运行的服务中的同步任务标记为失败
+os.environ.setdefault('RUN_STARTUP_TASKS', 'false')
+
 from app import create_app
 from app.extensions import db
 from app.models import Note, Account, Cookie
@@ -105,12 +109,12 @@ def fetch_user_xsec_token(user_id, xhs_apis, cookie_str):
 
 def load_progress():
     """加载进度"""
-    if os.path.exists(PROGRESS_FILE):
-        try:
-            with open(PROGRESS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
+    try:
+        with open(PROGRESS_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # 文件不存在或内容损坏时从头开始
+        pass
     return {'processed_note_ids': [], 'last_user_id': None, 'stats': {'success': 0, 'failed': 0, 'skipped': 0}}
 
 def save_progress(progress):
@@ -433,10 +437,10 @@ def show_stats():
 
 def reset_progress():
     """重置进度"""
-    if os.path.exists(PROGRESS_FILE):
+    try:
         os.remove(PROGRESS_FILE)
         print("进度已重置")
-    else:
+    except FileNotFoundError:
         print("没有进度文件")
 
 if __name__ == '__main__':
@@ -0,0 +1,20 @@
+"""
+Gunicorn 配置
+生产环境通过 `gunicorn -c gunicorn.conf.py run:app` 启动，参数可用环境变量覆盖
+
+注意：同步任务队列和停止标志保存在进程内，多个 worker 时
+/sync/stop 可能落到未执行该任务的进程上，因此默认只开少量 worker，
+并发主要依靠 gthread 线程
+"""
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = 'gthread'
+workers = int(os.environ.get('GUNICORN_WORKERS', '2'))
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+# 同步在后台线程中运行，不受请求超时影响；这里只约束单个 HTTP 请求
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
@@ -26,6 +26,9 @@ import sys
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# CLI runs are short-lived and may run before tables exist: skip startup tasks
+os.environ.setdefault('RUN_STARTUP_TASKS', 'false')
+
 from flask.cli import with_appcontext
 import click
 
@@ -17,9 +17,11 @@ import sys
 import argparse
 import time
 from datetime import datetime
+from functools import lru_cache
 
 try:
-    from sqlalchemy import create_engine, text, inspect
+    from sqlalchemy import Boolean, DateTime, create_engine, event, text, inspect
+    from sqlalchemy.engine import make_url
     from sqlalchemy.orm import sessionmaker
 except ImportError:
     print("Error: SQLAlchemy is required. Install with: pip install sqlalchemy")
@@ -28,6 +30,17 @@ except ImportError:
 # Batch size for migration
 BATCH_SIZE = 1000
 
+# Minimum seconds between progress lines
+PROGRESS_INTERVAL = 0.5
+
+# Read-side tuning for the source SQLite database. journal_mode is left alone
+# so the source file is not modified by the migration.
+SQLITE_READ_PRAGMAS = (
+    'PRAGMA cache_size=-524288',      # 512MB page cache
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=2147483648',    # 2GB memory-mapped reads
+)
+
 
 def get_sqlite_engine(sqlite_path):
     """Create SQLite engine"""
@@ -35,19 +48,40 @@ def get_sqlite_engine(sqlite_path):
         print(f"Error: SQLite database not found: {sqlite_path}")
         sys.exit(1)
     
-    return create_engine(
+    engine = create_engine(
         f'sqlite:///{sqlite_path}',
         connect_args={'check_same_thread': False}
     )
+    
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        for pragma in SQLITE_READ_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+    
+    return engine
 
 
 def get_pg_engine(pg_url):
-    """Create PostgreSQL engine"""
+    """Create PostgreSQL engine
+    
+    The migration is a single short-lived process holding one connection per
+    table, so no liveness ping on checkout and only a small pool are needed.
+    """
+    engine_options = {}
+    if make_url(pg_url).get_driver_name() == 'psycopg2':
+        # Send executemany batches as pages of statements (psycopg2 execute_batch)
+        # instead of one round trip per row
+        engine_options['executemany_mode'] = 'values_plus_batch'
+    
     return create_engine(
         pg_url,
-        pool_size=10,
+        pool_size=4,
+        max_overflow=0,
         pool_recycle=300,
-        pool_pre_ping=True
+        pool_pre_ping=False,
+        **engine_options
     )
 
 
@@ -71,11 +105,22 @@ def wait_for_postgres(engine, max_retries=30, retry_interval=2):
     return False
 
 
+@lru_cache(maxsize=None)
+def get_inspector(engine):
+    """Get a cached inspector for an engine"""
+    return inspect(engine)
+
+
+@lru_cache(maxsize=None)
+def get_column_types(engine, table_name):
+    """Get {column name: SQLAlchemy type} for a table (cached, schema does not change during migration)"""
+    columns = get_inspector(engine).get_columns(table_name)
+    return {col['name']: col['type'] for col in columns}
+
+
 def get_table_columns(engine, table_name):
     """Get column names for a table"""
-    inspector = inspect(engine)
-    columns = inspector.get_columns(table_name)
-    return [col['name'] for col in columns]
+    return tuple(get_column_types(engine, table_name))
 
 
 def get_row_count(engine, table_name):
@@ -85,6 +130,75 @@ def get_row_count(engine, table_name):
         return result.scalar()
 
 
+def _to_datetime(value):
+    """Convert ISO 8601 strings with 'Z' suffix to datetime, keep others as-is"""
+    if isinstance(value, str) and 'T' in value and value.endswith('Z'):
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            pass
+    return value
+
+
+def _to_bool(value):
+    """Convert SQLite 0/1 integers to bool"""
+    return bool(value) if isinstance(value, int) else value
+
+
+def classify_columns(columns, column_types):
+    """Find positions of columns that need conversion, based on target types
+    
+    Returns:
+        (datetime_indexes, boolean_indexes)
+    """
+    datetime_indexes = [i for i, col in enumerate(columns) if isinstance(column_types.get(col), DateTime)]
+    boolean_indexes = [i for i, col in enumerate(columns) if isinstance(column_types.get(col), Boolean)]
+    return datetime_indexes, boolean_indexes
+
+
+def convert_batch(rows, columns, datetime_indexes=(), boolean_indexes=()):
+    """Convert a batch of SQLite rows into PostgreSQL parameter dicts
+    
+    Column positions are classified once per table (see classify_columns).
+    The batch is transposed and only the classified columns are converted;
+    all other columns are passed through without any per-cell Python work.
+    """
+    if not datetime_indexes and not boolean_indexes:
+        return [dict(zip(columns, row)) for row in rows]
+    
+    column_values = list(zip(*rows))
+    for i in boolean_indexes:
+        column_values[i] = [_to_bool(v) for v in column_values[i]]
+    for i in datetime_indexes:
+        column_values[i] = [_to_datetime(v) for v in column_values[i]]
+    
+    return [dict(zip(columns, values)) for values in zip(*column_values)]
+
+
+def insert_rows(conn, statement, rows):
+    """Insert rows inside a SAVEPOINT, bisecting the batch on failure
+    
+    A failing batch is rolled back to its savepoint and split in half until
+    the bad rows are isolated, so one bad row costs O(log N) retries on the
+    same connection instead of a row-by-row replay of the whole batch.
+    
+    Returns:
+        Number of rows that could not be inserted
+    """
+    savepoint = conn.begin_nested()
+    try:
+        conn.execute(statement, rows)
+        savepoint.commit()
+        return 0
+    except Exception as e:
+        savepoint.rollback()
+        if len(rows) == 1:
+            print(f"    Warning: Failed to insert row: {e}")
+            return 1
+        mid = len(rows) // 2
+        return insert_rows(conn, statement, rows[:mid]) + insert_rows(conn, statement, rows[mid:])
+
+
 def create_pg_tables(pg_engine):
     """Create tables in PostgreSQL using raw DDL"""
     print("\nCreating PostgreSQL tables...")
@@ -116,10 +230,13 @@ def create_pg_tables(pg_engine):
             )
         """))
         
-        # Create index on user_id
+        # Create indexes on user_id and status (sync status polling / stale task cleanup)
         conn.execute(text("""
             CREATE INDEX IF NOT EXISTS ix_accounts_user_id ON accounts(user_id)
         """))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_accounts_status ON accounts(status)
+        """))
         
         # Create notes table
         conn.execute(text("""
@@ -135,7 +252,7 @@ def create_pg_tables(pg_engine):
                 collected_count INTEGER DEFAULT 0,
                 comment_count INTEGER DEFAULT 0,
                 share_count INTEGER DEFAULT 0,
-                upload_time VARCHAR(64),
+                upload_time VARCHAR(64) COLLATE "C",
                 video_addr VARCHAR(512),
                 image_list TEXT,
                 tags TEXT,
@@ -147,6 +264,18 @@ def create_pg_tables(pg_engine):
             )
         """))
         
+        # Existing tables were created with the default collation; switch
+        # upload_time to "C" so they match the model (this also rebuilds the
+        # indexes on it, so only run it when the collation differs)
+        collation = conn.execute(text("""
+            SELECT collation_name FROM information_schema.columns
+            WHERE table_name = 'notes' AND column_name = 'upload_time'
+        """)).scalar()
+        if collation != 'C':
+            conn.execute(text("""
+                ALTER TABLE notes ALTER COLUMN upload_time TYPE VARCHAR(64) COLLATE "C"
+            """))
+        
         # Create indexes on notes
         conn.execute(text("""
             CREATE INDEX IF NOT EXISTS ix_notes_user_id ON notes(user_id)
@@ -157,11 +286,23 @@ def create_pg_tables(pg_engine):
         conn.execute(text("""
             CREATE INDEX IF NOT EXISTS ix_notes_upload_time ON notes(upload_time)
         """))
+        # Newest-first per user, matching the note list order; replaces the
+        # ascending ix_notes_user_upload_time
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_notes_user_upload_time_desc
+            ON notes(user_id, upload_time DESC)
+        """))
         conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS ix_notes_user_upload_time ON notes(user_id, upload_time)
+            DROP INDEX IF EXISTS ix_notes_user_upload_time
         """))
+        # (user_id, type, upload_time DESC) replaces the old (user_id, type) index:
+        # it covers the same prefix and also serves the sorted note list query
         conn.execute(text("""
-            CREATE INDEX IF NOT EXISTS ix_notes_user_type ON notes(user_id, type)
+            CREATE INDEX IF NOT EXISTS ix_notes_user_type_upload_time
+            ON notes(user_id, type, upload_time DESC) INCLUDE (title)
+        """))
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_notes_user_type
         """))
         
         # Create cookies table
@@ -184,6 +325,11 @@ def create_pg_tables(pg_engine):
                 invalidated_at TIMESTAMP
             )
         """))
+        # Active-cookie lookup: WHERE is_active AND is_valid ORDER BY updated_at DESC
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_cookies_active_valid_updated
+            ON cookies(is_active, is_valid, updated_at DESC)
+        """))
         
         conn.commit()
     
@@ -215,6 +361,11 @@ def migrate_table(sqlite_engine, pg_engine, table_name, batch_size=BATCH_SIZE):
     
     print(f"    Migrating columns: {len(common_columns)}")
     
+    # Classify conversions once per table instead of testing every cell
+    datetime_indexes, boolean_indexes = classify_columns(
+        common_columns, get_column_types(pg_engine, table_name)
+    )
+    
     # Determine primary key for conflict resolution
     pk_column = 'id' if 'id' in common_columns else common_columns[0]
     if table_name == 'notes':
@@ -224,81 +375,66 @@ def migrate_table(sqlite_engine, pg_engine, table_name, batch_size=BATCH_SIZE):
     update_cols = ', '.join([f'"{c}" = EXCLUDED."{c}"' for c in common_columns if c != pk_column])
     
     if update_cols:
-        upsert_query = f"""
-            INSERT INTO {table_name} ({columns_str})
-            VALUES ({placeholders})
-            ON CONFLICT ("{pk_column}") DO UPDATE SET {update_cols}
-        """
+        conflict_clause = f'ON CONFLICT ("{pk_column}") DO UPDATE SET {update_cols}'
     else:
-        upsert_query = f"""
+        conflict_clause = f'ON CONFLICT ("{pk_column}") DO NOTHING'
+    
+    def build_upsert(values):
+        return f"""
             INSERT INTO {table_name} ({columns_str})
-            VALUES ({placeholders})
-            ON CONFLICT ("{pk_column}") DO NOTHING
+            VALUES ({values})
+            {conflict_clause}
         """
     
+    # On PostgreSQL the upsert is prepared once per table and every batch only
+    # sends EXECUTE with parameters, so the server plans the statement once
+    use_prepared = pg_engine.dialect.name == 'postgresql'
+    statement_name = f"migrate_upsert_{table_name}"
+    if use_prepared:
+        positional = ', '.join(f'${i}' for i in range(1, len(common_columns) + 1))
+        prepare_statement = text(f"PREPARE {statement_name} AS {build_upsert(positional)}")
+        upsert_statement = text(f"EXECUTE {statement_name} ({placeholders})")
+    else:
+        upsert_statement = text(build_upsert(placeholders))
+    
     # Migrate in batches
     migrated = 0
-    offset = 0
-    
-    while offset < source_count:
-        # Read batch from SQLite
-        with sqlite_engine.connect() as sqlite_conn:
-            result = sqlite_conn.execute(
-                text(f"SELECT {columns_str} FROM {table_name} LIMIT {batch_size} OFFSET {offset}")
-            )
-            rows = result.fetchall()
-        
-        if not rows:
-            break
+    failed = 0
+    last_progress = time.monotonic()
+    
+    # One connection per side and a single PostgreSQL transaction for the whole
+    # table. The source is read through a single streamed cursor, so memory
+    # stays at one batch and there is no LIMIT/OFFSET rescan per batch.
+    with sqlite_engine.connect() as sqlite_conn, pg_engine.begin() as pg_conn:
+        if use_prepared:
+            pg_conn.execute(prepare_statement)
         
-        # Convert rows to dicts
-        batch_data = []
-        # Boolean columns that need conversion from SQLite integer to PostgreSQL boolean
-        boolean_columns = {'is_active', 'is_valid'}
+        result = sqlite_conn.execution_options(stream_results=True, yield_per=batch_size).execute(
+            text(f"SELECT {columns_str} FROM {table_name}")
+        )
         
-        for row in rows:
-            row_dict = {}
-            for i, col in enumerate(common_columns):
-                value = row[i]
-                # Handle datetime conversion
-                if isinstance(value, str) and 'T' in value and value.endswith('Z'):
-                    try:
-                        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                    except ValueError:
-                        pass
-                # Handle boolean conversion (SQLite stores as 0/1 integer)
-                if col in boolean_columns and isinstance(value, int):
-                    value = bool(value)
-                row_dict[col] = value
-            batch_data.append(row_dict)
+        for rows in result.partitions(batch_size):
+            # Convert rows to dicts (column-wise, see convert_batch)
+            batch_data = convert_batch(rows, common_columns, datetime_indexes, boolean_indexes)
+            
+            # Insert batch into PostgreSQL (bad rows are isolated via savepoints)
+            failed += insert_rows(pg_conn, upsert_statement, batch_data)
+            
+            migrated += len(rows)
+            
+            # Progress update (throttled, stdout is slow in containers)
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                last_progress = now
+                progress = min(100, int(migrated / source_count * 100))
+                print(f"    Progress: {migrated}/{source_count} ({progress}%)", end='\r')
         
-        # Insert batch into PostgreSQL
-        with pg_engine.connect() as pg_conn:
-            try:
-                # Try batch insert first
-                for row_dict in batch_data:
-                    pg_conn.execute(text(upsert_query), row_dict)
-                pg_conn.commit()
-            except Exception:
-                # If batch fails, rollback and try row by row
-                pg_conn.rollback()
-                for row_dict in batch_data:
-                    try:
-                        with pg_engine.connect() as single_conn:
-                            single_conn.execute(text(upsert_query), row_dict)
-                            single_conn.commit()
-                    except Exception as e:
-                        print(f"    Warning: Failed to insert row: {e}")
-                        continue
-        
-        migrated += len(rows)
-        offset += batch_size
-        
-        # Progress update
-        progress = min(100, int(migrated / source_count * 100))
-        print(f"    Progress: {migrated}/{source_count} ({progress}%)", end='\r')
+        if use_prepared:
+            pg_conn.execute(text(f"DEALLOCATE {statement_name}"))
     
     print(f"    Progress: {migrated}/{source_count} (100%)    ")
+    if failed:
+        print(f"    Failed rows: {failed}")
     
     # Verify migration
     dest_count = get_row_count(pg_engine, table_name)
@@ -307,16 +443,24 @@ def migrate_table(sqlite_engine, pg_engine, table_name, batch_size=BATCH_SIZE):
     return source_count, dest_count
 
 
-def verify_migration(sqlite_engine, pg_engine, tables):
-    """Verify data integrity after migration"""
+def verify_migration(sqlite_engine, pg_engine, tables, results=None):
+    """Verify data integrity after migration
+    
+    Source counts already measured by migrate_table are reused from
+    ``results``; only the destination is counted again.
+    """
     print("\n" + "=" * 50)
     print("Data Verification")
     print("=" * 50)
     
     all_passed = True
     
+    results = results or {}
+    
     for table in tables:
-        source_count = get_row_count(sqlite_engine, table)
+        source_count = results.get(table, {}).get('source')
+        if source_count is None or 'error' in results.get(table, {}):
+            source_count = get_row_count(sqlite_engine, table)
         dest_count = get_row_count(pg_engine, table)
         
         status = "✓" if source_count == dest_count else "✗"
@@ -349,6 +493,25 @@ def reset_sequences(pg_engine, tables_with_serial):
             print(f"  Warning: Could not reset sequence for {table}: {e}")
 
 
+def analyze_tables(pg_engine, tables):
+    """Refresh planner statistics after the bulk load
+    
+    Freshly loaded tables have no statistics until autovacuum gets to them,
+    so the planner may ignore the composite indexes for the first queries.
+    """
+    print("\nAnalyzing PostgreSQL tables...")
+    
+    with pg_engine.connect() as conn:
+        for table in tables:
+            try:
+                conn.execute(text(f"ANALYZE {table}"))
+                conn.commit()
+                print(f"  {table}: analyzed")
+            except Exception as e:
+                conn.rollback()
+                print(f"  Warning: Could not analyze {table}: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(description='Migrate SQLite to PostgreSQL')
     parser.add_argument('--sqlite-path', 
@@ -407,9 +570,12 @@ def main():
     # Reset sequences for tables with SERIAL primary keys
     reset_sequences(pg_engine, [('accounts', 'id'), ('cookies', 'id')])
     
+    # Update planner statistics so the new indexes are used right away
+    analyze_tables(pg_engine, tables)
+    
     # Verify if not skipped
     if not args.skip_verify:
-        all_passed = verify_migration(sqlite_engine, pg_engine, tables)
+        all_passed = verify_migration(sqlite_engine, pg_engine, tables, results)
     else:
         all_passed = True
         print("\nVerification skipped")
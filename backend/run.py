@@ -16,18 +16,9 @@ import os
 # 添加 backend 目录到 Python 路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# 加载环境变量
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
+# 环境变量（.env）在导入 app.config 时加载
 from app import create_app, WEBSOCKET_AVAILABLE, socketio
-from app.config import Config, get_config
-
-# 初始化数据目录
-Config.init_paths()
+from app.config import get_config
 
 # 获取配置类
 config_class = get_config()
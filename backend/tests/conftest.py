@@ -7,12 +7,17 @@ import os
 import sys
 import pytest
 
+# Tests default to in-memory SQLite (see TestingConfig); Config requires DATABASE_URL
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('RUN_STARTUP_TASKS', 'false')
+
 # Add app to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app import create_app
 from app.extensions import db
 from app.config import TestingConfig
+from app.api.accounts import invalidate_accounts_cache
 
 
 @pytest.fixture(scope='session')
@@ -32,13 +37,34 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='function', autouse=True)
 def db_session(app):
-    """Create database session for testing."""
-    with app.app_context():
-        db.session.begin_nested()
+    """Run each test inside a transaction that is always rolled back.
+    
+    The engine is swapped for a single connection with an open transaction;
+    sessions (including those used by request handlers) join it through a
+    SAVEPOINT, so their commits never reach the database.
+    """
+    engine = db.engines[None]
+    connection = engine.connect()
+    transaction = connection.begin()
+    if connection.dialect.name == 'sqlite':
+        # pysqlite defers BEGIN until the first DML; start it explicitly so
+        # the SAVEPOINTs nest inside the outer transaction
+        connection.exec_driver_sql('BEGIN')
+    
+    db.session.remove()
+    db.engines[None] = connection
+    db.session.configure(join_transaction_mode='create_savepoint')
+    try:
         yield db.session
-        db.session.rollback()
+    finally:
+        db.session.remove()
+        db.session.configure(join_transaction_mode='conservative_savepoint')
+        db.engines[None] = engine
+        transaction.rollback()
+        connection.close()
+        invalidate_accounts_cache()
 
 
 @pytest.fixture
@@ -109,3 +109,53 @@ class TestAccountsStatusAPI:
         data = json.loads(response.data)
         assert data['success'] is True
         assert isinstance(data['data'], list)
+    
+    def test_get_accounts_status_not_modified(self, client):
+        """Test unchanged status returns 304 for a matching ETag."""
+        response = client.get('/api/accounts/status')
+        etag = response.headers.get('ETag')
+        assert etag
+        
+        response = client.get('/api/accounts/status', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
+
+class TestCookieSave:
+    """Tests for saving validated cookies."""
+    
+    def test_save_validated_cookie(self, app):
+        """Test same-user save updates in place and clears failed accounts."""
+        from app.api.auth import save_validated_cookie
+        from app.extensions import db
+        from app.models import Account, Cookie
+        
+        with app.app_context():
+            db.session.add(Account(user_id='failed_user', status='failed', error_message='expired'))
+            db.session.commit()
+            
+            other = save_validated_cookie('a1=other', 'u2', 'Other', '')
+            first = save_validated_cookie('a1=old', 'u1', 'User', '')
+            second = save_validated_cookie('a1=new', 'u1', 'User', '')
+            
+            assert second.id == first.id
+            assert Cookie.get_active_cookie_str() == 'a1=new'
+            assert db.session.get(Cookie, other.id).is_active is False
+            assert Account.query.filter_by(user_id='failed_user').first().status == 'pending'
+
+
+class TestJsonProvider:
+    """Tests for the orjson JSON provider."""
+    
+    def test_matches_default_provider(self, app):
+        """Test keys are sorted like DefaultJSONProvider and unsupported kwargs fall back."""
+        import json
+        from datetime import datetime
+        from flask.json.provider import DefaultJSONProvider
+        
+        data = {'b': 1, 'a': {'d': datetime(2024, 1, 2), 'c': '中文'}}
+        default = DefaultJSONProvider(app)
+        
+        assert json.loads(app.json.dumps(data)) == json.loads(default.dumps(data))
+        assert app.json.dumps(data).index('"a"') < app.json.dumps(data).index('"b"')
+        assert app.json.dumps(data, separators=(',', ':')) == app.json.dumps(data)
+        assert app.json.dumps(data, ensure_ascii=True) == default.dumps(data)
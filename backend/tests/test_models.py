@@ -6,7 +6,7 @@ Tests for database models: Account, Note, Cookie
 import pytest
 from datetime import datetime
 
-from app.models import Account, Note
+from app.models import Account, Note, Cookie
 from app.extensions import db
 
 
@@ -113,3 +113,21 @@ class TestNoteModel:
             
             assert isinstance(images, list)
             assert len(images) == 1
+
+
+class TestCookieModel:
+    """Tests for Cookie model."""
+    
+    def test_get_active_cookie_str(self, app):
+        """Test active cookie lookup decrypts and skips inactive/invalid rows."""
+        with app.app_context():
+            assert Cookie.get_active_cookie_str() == ''
+            
+            inactive = Cookie(is_active=False, is_valid=True)
+            inactive.set_cookie_str('a1=inactive')
+            active = Cookie(is_active=True, is_valid=True)
+            active.set_cookie_str('a1=active')
+            db.session.add_all([inactive, active])
+            db.session.commit()
+            
+            assert Cookie.get_active_cookie_str() == 'a1=active'
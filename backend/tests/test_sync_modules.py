@@ -60,6 +60,19 @@ class TestAdaptiveDelayManager:
         recovered_delay = manager.get_stats()['current_delay']
         assert recovered_delay < high_delay
     
+    def test_rate_limit_wait_decorrelated(self):
+        """Test cooldown stays within [current_delay, max_delay] and is stable per event."""
+        from app.services.sync.delay_manager import AdaptiveDelayManager
+        
+        manager = AdaptiveDelayManager(initial_delay=10.0, backoff_factor=2.0, max_delay=100.0)
+        
+        for _ in range(5):
+            manager.record_rate_limit()
+            current = manager.get_stats()['current_delay']
+            wait = manager.get_rate_limit_wait()
+            assert current <= wait <= 100.0
+            assert manager.get_rate_limit_wait() == wait
+    
     def test_reset(self):
         """Test reset returns to initial state."""
         from app.services.sync.delay_manager import AdaptiveDelayManager
@@ -124,6 +137,18 @@ class TestSyncLogCollector:
         assert logs['summary']['success'] == 1
         assert len(logs['issues']) == 1
     
+    def test_issue_cap_keeps_counting(self):
+        """Test issues past MAX_ISSUES are counted but not stored."""
+        from app.services.sync.log_collector import SyncLogCollector
+        
+        collector = SyncLogCollector(account_id=1)
+        for i in range(SyncLogCollector.MAX_ISSUES + 5):
+            collector.add_issue(SyncLogCollector.TYPE_MISSING_FIELD, note_id=f'n{i}')
+        collector.add_issue(SyncLogCollector.TYPE_AUTH_ERROR)
+        
+        assert collector.get_issue_count() == SyncLogCollector.MAX_ISSUES
+        assert collector.get_summary()['missing_field'] == SyncLogCollector.MAX_ISSUES + 5
+    
     def test_has_problems(self):
         """Test problem detection."""
         from app.services.sync.log_collector import SyncLogCollector
@@ -156,3 +181,111 @@ class TestRequestSessionPool:
         
         assert 'requests' in stats
         assert 'errors' in stats
+    
+    def test_module_requests_use_pool(self):
+        """Test module-level requests calls are routed through the pooled session."""
+        import sys
+        import types
+        import requests
+        from app.services.sync.spider import _use_pooled_session
+        from app.services.sync.session_pool import get_request_session_pool
+        
+        module = types.ModuleType('fake_xhs_apis')
+        module.requests = requests
+        exec(
+            "class Apis:\n"
+            "    def fetch(self):\n"
+            "        return requests.get('https://example.com', timeout=5)\n",
+            module.__dict__
+        )
+        with patch.dict(sys.modules, {'fake_xhs_apis': module}):
+            assert _use_pooled_session(module.Apis()) is True
+        
+        assert module.requests.exceptions is requests.exceptions
+        with patch.object(get_request_session_pool().session, 'request', return_value='ok') as request:
+            assert module.Apis().fetch() == 'ok'
+        request.assert_called_once_with('GET', 'https://example.com', params=None, timeout=5)
+
+
+class TestNoteData:
+    """Tests for NoteData."""
+    
+    def test_from_dict_resolves_cover(self):
+        """Test cover falls back from video cover to first image."""
+        from app.services.sync.note_data import NoteData
+        
+        data = NoteData.from_dict({'note_id': 'n1', 'image_list': ['a', 'b']})
+        assert data.cover_remote == 'a'
+        
+        data = NoteData.from_dict({'note_id': 'n1', 'video_cover': 'v', 'image_list': ['a']})
+        assert data.cover_remote == 'v'
+    
+    def test_apply_keeps_missing_counts(self):
+        """Test update keeps stored values for fields the source lacks."""
+        from types import SimpleNamespace
+        from datetime import datetime
+        from app.services.sync.note_data import NoteData
+        
+        note = SimpleNamespace(
+            nickname='', avatar='', title='', desc='old', type='',
+            liked_count=1, collected_count=2, comment_count=3, share_count=4,
+            upload_time='2024-01-01 00:00:00', video_addr='',
+            image_list='["a", "b"]', tags='[]', ip_location='',
+            cover_remote='', xsec_token='', last_updated=None
+        )
+        NoteData.from_dict({'note_id': 'n1', 'liked_count': 9, 'image_list': ['a']}).apply_to(note, datetime.utcnow())
+        
+        assert note.liked_count == 9
+        assert note.collected_count == 2
+        assert note.desc == 'old'
+        assert note.upload_time == '2024-01-01 00:00:00'
+        assert note.image_list == '["a", "b"]'
+    
+    def test_upsert_matches_apply(self, app):
+        """Test a conflicting insert merges like apply_to."""
+        from datetime import datetime
+        from app.extensions import db
+        from app.models import Note
+        from app.services.sync.note_data import NoteData
+        from app.services.sync_service import SyncService
+        
+        now = datetime.utcnow()
+        stored = {'note_id': 'n1', 'liked_count': 5, 'image_list': ['a', 'b'], 'tags': ['t']}
+        SyncService._insert_notes([NoteData.from_dict(stored).to_mapping(now)])
+        
+        update = {'note_id': 'n1', 'image_list': ['a']}
+        SyncService._insert_notes([NoteData.from_dict(update).to_mapping(now)])
+        note = Note.query.filter_by(note_id='n1').one()
+        db.session.refresh(note)
+        assert note.liked_count == 5
+        assert note.get_image_list() == ['a', 'b']
+        assert note.get_tags() == ['t']
+        
+        update = {'note_id': 'n1', 'image_list': ['a', 'b', 'c'], 'tags': ['u']}
+        SyncService._insert_notes([NoteData.from_dict(update).to_mapping(now)])
+        db.session.refresh(note)
+        assert note.get_image_list() == ['a', 'b', 'c']
+        assert note.get_tags() == ['u']
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+    
+    def test_burst_then_wait(self):
+        """Test burst tokens are immediate and the next one waits for refill."""
+        from app.services.sync.rate_limiter import TokenBucket
+        
+        bucket = TokenBucket(rate=20.0, capacity=2)
+        assert bucket.acquire() < 0.01
+        assert bucket.acquire() < 0.01
+        
+        waited = bucket.acquire()
+        assert 0.02 <= waited < 0.5
+    
+    def test_acquire_over_capacity_raises(self):
+        """Test requesting more tokens than the capacity fails instead of hanging."""
+        from app.services.sync.rate_limiter import TokenBucket
+        
+        bucket = TokenBucket(rate=20.0, capacity=0.5)
+        with pytest.raises(ValueError):
+            bucket.acquire()